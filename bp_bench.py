@@ -0,0 +1,542 @@
+"""
+Benchmarks for bp_tracker
+=========================
+Headless timing harness for the well-being tracker. Results are printed as a
+Rich table and can be written as JSON for tracking over time.
+
+```bash
+# cold-start latency of each CLI command (python -X importtime)
+python bp_bench.py startup --runs 5 --out startup.json
+
+# storage layout: legacy TEXT-date table vs. the current migrated schema
+python bp_bench.py schema --years 50 --out schema.json
+
+# writes, reads, table/chart rendering and TUI load over 1, 10 and 50 years,
+# plus raw per-second samples
+python bp_bench.py suite --out suite.json
+```
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import datetime as _dt
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+import typer
+
+TRACKER = Path(__file__).with_name("bp_tracker.py")
+console = Console()
+app = typer.Typer(add_completion=False, pretty_exceptions_show_locals=False)
+
+# Command lines timed by ``startup``; each runs against a throwaway database.
+STARTUP_COMMANDS: dict[str, list[str]] = {
+    "help": ["--help"],
+    "add": [
+        "add",
+        "--date=2024-01-01",
+        "--sleep-hours=7",
+        "--hrv=50",
+        "--typing-variability=120",
+        "--speech-rate=130",
+        "--mood=7",
+        "--output-quality=7",
+        "--spiritual-depth=5",
+    ],
+    "list": ["list", "--page-size=30"],
+    "export": ["export", "--format=jsonl"],
+    "stats": ["stats", "--recent=0"],
+    "chart": ["chart", "hrv"],
+}
+# The ``metrics`` table as it was before migration 1 (schema 0), for ``schema``.
+LEGACY_METRICS = """
+CREATE TABLE metrics (
+    date TEXT PRIMARY KEY,
+    sleep_hours REAL,
+    hrv REAL,
+    typing_variability REAL,
+    speech_rate INTEGER,
+    mood INTEGER,
+    output_quality INTEGER,
+    spiritual_depth INTEGER
+)
+"""
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "timestamp": _dt.datetime.now(_dt.timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+
+def _write_results(results: dict[str, Any], out: Path | None) -> None:
+    if out is None:
+        return
+    out.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    console.print(f"[green]Wrote {out}.[/green]")
+
+
+def _parse_importtime(stderr: str) -> tuple[float, list[tuple[str, float]]]:
+    """Total import time and the slowest top-level imports, in milliseconds."""
+    total = 0
+    top: list[tuple[str, float]] = []
+    for match in _IMPORTTIME.finditer(stderr):
+        self_us, cumulative_us, indent, name = match.groups()
+        total += int(self_us)
+        if not indent:
+            top.append((name, int(cumulative_us) / 1000))
+    top.sort(key=lambda item: item[1], reverse=True)
+    return total / 1000, top
+
+
+def _time_command(args: list[str], env: dict[str, str]) -> tuple[float, str]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", str(TRACKER), *args],
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if proc.returncode:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{proc.stderr[-2000:]}")
+    return elapsed, proc.stderr
+
+
+def _synthetic_rows(years: int, seed: int = 0) -> list[tuple[Any, ...]]:
+    """One plausible daily row per day for ``years`` years up to today."""
+    rng = random.Random(seed)
+    today = _dt.date.today()
+    first = today - _dt.timedelta(days=365 * years - 1)
+    return [
+        (
+            (first + _dt.timedelta(days=i)).isoformat(),
+            round(rng.uniform(4, 9), 1),
+            rng.gauss(55, 12),
+            rng.gauss(120, 25),
+            rng.randint(90, 180),
+            rng.randint(1, 10),
+            rng.randint(1, 10),
+            rng.randint(1, 10),
+        )
+        for i in range(365 * years)
+    ]
+
+
+def _median_ms(fn: Any, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def _bench_layout(
+    conn: sqlite3.Connection,
+    key: str,
+    metrics: list[str],
+    rows: list[tuple[Any, ...]],
+    to_key: Any,
+    runs: int,
+    singles: int,
+) -> dict[str, float]:
+    """Insert, scan and size figures for one ``metrics`` layout."""
+    insert = (
+        f"INSERT OR REPLACE INTO metrics ({', '.join([key, *metrics])}) "
+        f"VALUES ({', '.join('?' * (len(metrics) + 1))})"
+    )
+    keyed = [(to_key(r[0]), *r[1:]) for r in rows]
+    start = time.perf_counter()
+    with conn:
+        conn.executemany(insert, keyed)
+    bulk_s = time.perf_counter() - start
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for row in rng.sample(keyed, min(singles, len(keyed))):
+        with conn:
+            conn.execute(insert, row)
+    single_us = (time.perf_counter() - start) / max(min(singles, len(keyed)), 1) * 1e6
+    year_ago = to_key((_dt.date.today() - _dt.timedelta(days=365)).isoformat())
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    return {
+        "bulk_insert_rows_per_s": round(len(keyed) / bulk_s),
+        "single_upsert_us": round(single_us, 1),
+        "full_scan_ms": _median_ms(
+            lambda: conn.execute(f"SELECT * FROM metrics ORDER BY {key}").fetchall(), runs
+        ),
+        "year_scan_ms": _median_ms(
+            lambda: conn.execute(
+                f"SELECT * FROM metrics WHERE {key} >= ? ORDER BY {key}", (year_ago,)
+            ).fetchall(),
+            runs,
+        ),
+        "year_aggregate_ms": _median_ms(
+            lambda: conn.execute(
+                f"SELECT AVG(hrv), AVG(mood) FROM metrics WHERE {key} >= ?", (year_ago,)
+            ).fetchone(),
+            runs,
+        ),
+        "file_bytes": page_count * page_size,
+    }
+
+
+@app.callback()
+def main() -> None:
+    """Benchmarks for bp_tracker."""
+
+
+@app.command()
+def startup(
+    runs: int = typer.Option(5, help="Runs per command; the median is reported"),
+    command: list[str] = typer.Option([], "--command", "-c", help="Repeat to select"),
+    out: Path | None = typer.Option(None, help="Write results as JSON"),
+):
+    """Cold-start latency per CLI command, with -X importtime breakdown."""
+    selected = command or list(STARTUP_COMMANDS)
+    unknown = set(selected) - set(STARTUP_COMMANDS)
+    if unknown:
+        raise typer.BadParameter(f"Unknown command(s): {', '.join(sorted(unknown))}")
+    results: dict[str, Any] = {"environment": _environment(), "commands": {}}
+    tbl = Table(title="CLI startup", header_style="bold magenta")
+    for col in ("command", "median ms", "min ms", "import ms", "heaviest imports"):
+        tbl.add_column(col)
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "BP_TRACKER_DB": str(Path(tmp) / "bench.db"),
+            "MPLBACKEND": "Agg",
+        }
+        # Seed one entry first so read commands have something to do.
+        _time_command(STARTUP_COMMANDS["add"], env)
+        for name in selected:
+            wall: list[float] = []
+            imports: list[float] = []
+            for _ in range(runs):
+                elapsed, stderr = _time_command(STARTUP_COMMANDS[name], env)
+                total, top = _parse_importtime(stderr)
+                wall.append(elapsed)
+                imports.append(total)
+            results["commands"][name] = {
+                "argv": STARTUP_COMMANDS[name],
+                "wall_ms": wall,
+                "median_ms": statistics.median(wall),
+                "import_ms": statistics.median(imports),
+                "top_imports": dict(top[:10]),
+            }
+            tbl.add_row(
+                name,
+                f"{statistics.median(wall):.1f}",
+                f"{min(wall):.1f}",
+                f"{statistics.median(imports):.1f}",
+                ", ".join(f"{mod} {ms:.0f}" for mod, ms in top[:3]),
+            )
+    console.print(tbl)
+    _write_results(results, out)
+
+
+@app.command()
+def schema(
+    years: int = typer.Option(50, min=1, help="Years of synthetic daily entries"),
+    runs: int = typer.Option(7, help="Runs per scan; the median is reported"),
+    singles: int = typer.Option(500, help="Individually committed upserts to time"),
+    out: Path | None = typer.Option(None, help="Write results as JSON"),
+):
+    """Insert and scan cost of the legacy TEXT-date table vs. the current schema.
+
+    Both layouts are bare tables (no rollup or version triggers), so the
+    figures isolate the storage change; the current one also reports the
+    cost of converting epoch days back to ISO dates, as the query layer does.
+    """
+    import bp_tracker
+
+    rows = _synthetic_rows(years)
+    metrics = list(bp_tracker.Entry.columns()[1:])
+    results: dict[str, Any] = {
+        "environment": _environment(),
+        "rows": len(rows),
+        "layouts": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "legacy.db"
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute(LEGACY_METRICS)
+            results["layouts"]["legacy"] = _bench_layout(
+                conn, "date", metrics, rows, str, runs, singles
+            )
+        conn.close()
+        migrated = Path(tmp) / "migrated.db"
+        shutil.copy(legacy_path, migrated)
+        conn = sqlite3.connect(migrated)
+        start = time.perf_counter()
+        bp_tracker._migrate(conn)
+        results["migrate_ms"] = (time.perf_counter() - start) * 1000
+        conn.close()
+        conn = sqlite3.connect(Path(tmp) / "current.db")
+        bp_tracker._migrate(conn)
+        current = _bench_layout(
+            conn, "day", metrics, rows, bp_tracker._epoch_day, runs, singles
+        )
+        current["full_scan_iso_ms"] = _median_ms(
+            lambda: conn.execute(
+                "SELECT date(day * 86400, 'unixepoch'), * FROM metrics ORDER BY day"
+            ).fetchall(),
+            runs,
+        )
+        conn.close()
+        results["layouts"]["current"] = current
+    legacy = results["layouts"]["legacy"]
+    tbl = Table(
+        title=f"metrics layout, {len(rows)} rows (migration {results['migrate_ms']:.0f} ms)",
+        header_style="bold magenta",
+    )
+    for col in ("measure", "legacy", "current", "current / legacy"):
+        tbl.add_column(col, justify="right" if col != "measure" else "left")
+    for measure, value in current.items():
+        before = legacy.get(measure)
+        tbl.add_row(
+            measure,
+            "" if before is None else f"{before:,.2f}",
+            f"{value:,.2f}",
+            "" if not before else f"{value / before:.2f}",
+        )
+    console.print(tbl)
+    _write_results(results, out)
+
+
+SUITE_YEARS = (1, 10, 50)
+# Ranges (days back from today) for the fetch latencies; None is everything.
+SUITE_RANGES: tuple[int | None, ...] = (30, 365, 3650, None)
+SUITE_METRIC = "hrv"
+
+
+def _use_database(tracker: Any, tmp: Path, name: str) -> Path:
+    """Point the already-imported tracker at a fresh database and chart cache."""
+    path = tmp / f"{name}.db"
+    tracker.DB_PATH = path
+    tracker.CHART_CACHE = tmp / f"{name}-charts"
+    tracker.autoinit_done = False
+    return path
+
+
+def _entries(tracker: Any, rows: list[tuple[Any, ...]]) -> list[Any]:
+    return [tracker.Entry(*r) for r in rows]
+
+
+def _range_label(days: int | None) -> str:
+    return "all" if days is None else f"{days}d"
+
+
+def _bench_tui(tracker: Any, runs: int) -> dict[str, float] | None:
+    """Headless Textual timings: first page on mount, then median reloads."""
+    app_class = tracker._tui_app()
+    if app_class is None:
+        return None
+    import asyncio
+
+    async def measure() -> dict[str, float]:
+        start = time.perf_counter()
+        app = app_class()
+        async with app.run_test(size=(120, 40)) as pilot:
+            await pilot.pause()
+            mount_ms = (time.perf_counter() - start) * 1000
+            reloads = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                app.action_list()
+                await pilot.pause()
+                reloads.append((time.perf_counter() - start) * 1000)
+            return {
+                "mount_ms": mount_ms,
+                "reload_ms": statistics.median(reloads),
+                "rows_loaded": app.table.row_count,
+            }
+
+    return asyncio.run(measure())
+
+
+def _bench_dataset(
+    tracker: Any, rows: list[tuple[Any, ...]], runs: int, singles: int
+) -> dict[str, Any]:
+    result: dict[str, Any] = {"entries": len(rows)}
+    start = time.perf_counter()
+    tracker.add_entries(_entries(tracker, rows))
+    result["add_entries_rows_per_s"] = round(len(rows) / (time.perf_counter() - start))
+    # Single writes land after the history so they are inserts, not replaces.
+    last = _dt.date.fromisoformat(rows[-1][0])
+    extra = _entries(tracker, _synthetic_rows(1, seed=1)[:singles])
+    for i, e in enumerate(extra, start=1):
+        e.date = (last + _dt.timedelta(days=i)).isoformat()
+    start = time.perf_counter()
+    for e in extra:
+        tracker.add_entry(e)
+    result["add_entry_ms"] = (time.perf_counter() - start) * 1000 / max(len(extra), 1)
+
+    result["fetch_entries_ms"] = {}
+    result["fetch_series_ms"] = {}
+    for days in SUITE_RANGES:
+        label = _range_label(days)
+        result["fetch_entries_ms"][label] = _median_ms(
+            lambda: tracker.fetch_entries(days), runs
+        )
+        result["fetch_series_ms"][label] = _median_ms(
+            lambda: tracker.fetch_series(SUITE_METRIC, days), runs
+        )
+    result["first_page_ms"] = _median_ms(
+        lambda: tracker.query_entries(limit=tracker.PAGE_SIZE), runs
+    )
+
+    # Rich rendering into a buffer: the cost of building and laying out the
+    # table, without the terminal.
+    real_console = tracker.console
+    tracker.console = Console(file=io.StringIO(), width=120)
+    try:
+        result["render_table_ms"] = {}
+        for n in (tracker.PAGE_SIZE, 365):
+            page = tracker.query_entries(limit=n).rows
+            result["render_table_ms"][str(len(page))] = _median_ms(
+                lambda: tracker._render_table(page), runs
+            )
+    finally:
+        tracker.console = real_console
+
+    try:
+        tracker._pyplot()
+    except SystemExit:
+        result["render_chart_ms"] = None
+    else:
+        result["render_chart_ms"] = {}
+        for days in (365, None):
+            label = _range_label(days)
+            shutil.rmtree(tracker.CHART_CACHE, ignore_errors=True)
+            start = time.perf_counter()
+            tracker.render_chart(SUITE_METRIC, days)
+            cold = (time.perf_counter() - start) * 1000
+            warm = _median_ms(lambda: tracker.render_chart(SUITE_METRIC, days), runs)
+            result["render_chart_ms"][label] = {"cold": cold, "cached": warm}
+
+    result["tui"] = _bench_tui(tracker, runs)
+    return result
+
+
+def _bench_dense(tracker: Any, days: int, hz: float) -> dict[str, Any]:
+    """Per-sample variant: raw sensor readings, ingested then downsampled."""
+    step = int(1000 / hz)
+    per_day = 86_400_000 // step
+    first = tracker._day_start_ms(_dt.date.today() - _dt.timedelta(days=days))
+    rng = random.Random(2)
+    metrics = list(tracker.SAMPLE_METRICS)
+    n = days * per_day * len(metrics)
+    start = time.perf_counter()
+    with tracker.SampleWriter() as writer:
+        for metric in metrics:
+            for i in range(days * per_day):
+                writer.add(metric, first + i * step, rng.gauss(100, 20))
+    ingest_s = time.perf_counter() - start
+    start = time.perf_counter()
+    written = tracker.downsample_samples()
+    downsample_s = time.perf_counter() - start
+    return {
+        "samples": n,
+        "sample_hz": hz,
+        "ingest_samples_per_s": round(n / ingest_s),
+        "downsample_ms": downsample_s * 1000,
+        "days_downsampled": written,
+        "fetch_series_ms": _median_ms(
+            lambda: tracker.fetch_series(SUITE_METRIC, days), 5
+        ),
+    }
+
+
+@app.command()
+def suite(
+    years: list[int] = typer.Option(
+        list(SUITE_YEARS), "--years", "-y", help="History lengths; repeat to select"
+    ),
+    dense_days: int = typer.Option(3, help="Days of raw samples (0 skips)"),
+    dense_hz: float = typer.Option(1.0, help="Samples per second per metric"),
+    runs: int = typer.Option(5, help="Runs per read measurement; median reported"),
+    singles: int = typer.Option(200, help="Individually committed add_entry calls"),
+    out: Path | None = typer.Option(None, help="Write results as JSON"),
+):
+    """Write, read, render and TUI timings over synthetic multi-year histories."""
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    import bp_tracker
+
+    results: dict[str, Any] = {"environment": _environment(), "datasets": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in years:
+            name = f"{n}y"
+            console.print(f"[cyan]{name}: {365 * n} entries…[/cyan]")
+            _use_database(bp_tracker, Path(tmp), name)
+            results["datasets"][name] = _bench_dataset(
+                bp_tracker, _synthetic_rows(n), runs, singles
+            )
+        if dense_days:
+            console.print(f"[cyan]dense: {dense_days} days at {dense_hz:g} Hz…[/cyan]")
+            _use_database(bp_tracker, Path(tmp), "dense")
+            results["dense"] = _bench_dense(bp_tracker, dense_days, dense_hz)
+
+    tbl = Table(title="bp_tracker suite (ms unless noted)", header_style="bold magenta")
+    tbl.add_column("measure")
+    for name in results["datasets"]:
+        tbl.add_column(name, justify="right")
+    datasets = list(results["datasets"].values())
+
+    def row(label: str, get: Any, fmt: str = "{:.2f}") -> None:
+        cells = []
+        for d in datasets:
+            try:
+                value = get(d)
+            except (KeyError, TypeError):
+                value = None
+            cells.append("–" if value is None else fmt.format(value))
+        tbl.add_row(label, *cells)
+
+    row("add_entries rows/s", lambda d: d["add_entries_rows_per_s"], "{:,}")
+    row("add_entry", lambda d: d["add_entry_ms"])
+    for days in SUITE_RANGES:
+        label = _range_label(days)
+        row(f"fetch_entries {label}", lambda d, k=label: d["fetch_entries_ms"][k])
+        row(f"fetch_series {label}", lambda d, k=label: d["fetch_series_ms"][k])
+    row("first page", lambda d: d["first_page_ms"])
+    for size in ("30", "365"):
+        row(f"render table {size} rows", lambda d, k=size: d["render_table_ms"][k])
+    for label in ("365d", "all"):
+        row(f"chart {label} cold", lambda d, k=label: d["render_chart_ms"][k]["cold"])
+        row(f"chart {label} cached", lambda d, k=label: d["render_chart_ms"][k]["cached"])
+    row("tui mount", lambda d: d["tui"]["mount_ms"])
+    row("tui reload", lambda d: d["tui"]["reload_ms"])
+    console.print(tbl)
+    if "dense" in results:
+        dense = results["dense"]
+        console.print(
+            f"dense: {dense['samples']:,} samples at "
+            f"{dense['ingest_samples_per_s']:,}/s, downsampled "
+            f"{dense['days_downsampled']} days in {dense['downsample_ms']:.0f} ms"
+        )
+    _write_results(results, out)
+
+
+if __name__ == "__main__":
+    app()
@@ -12,25 +12,55 @@ Run modes
 ---------
 ```bash
 # interactive terminal UI (Textual)
-python wellbeing_tracker.py tui
+python bp_tracker.py tui
 
 # traditional CLI
-python wellbeing_tracker.py cli add
-python wellbeing_tracker.py cli chart hrv --days 30
+python bp_tracker.py cli add
+python bp_tracker.py cli chart hrv --days 30
+python bp_tracker.py cli export metrics.csv --start 2024-01-01
+
+# ingest daemon: one JSON record per line on a Unix socket
+python bp_tracker.py serve --socket /tmp/bp.sock
 
 # web dashboard
-streamlit run wellbeing_tracker.py
+streamlit run bp_tracker.py
+
+# stage and SQL timings (summary on stderr at exit; the env var also
+# works for the dashboard and can name a JSON file instead)
+python bp_tracker.py --profile list
+BP_TRACKER_PROFILE=profile.json streamlit run bp_tracker.py
 ```
 """
 
 from __future__ import annotations
 
+import atexit
+import bisect
+import collections
+import contextlib
+import csv
+import functools
+import hashlib
+import io
+import json
+import math
+import os
+import queue
+import shutil
+import signal
 import sqlite3
+import struct
 import sys
+import threading
+import time
 import datetime as _dt
+from array import array
 from pathlib import Path
 from dataclasses import dataclass, asdict, fields
-from typing import Any, List, Sequence
+from typing import IO, TYPE_CHECKING, Any, Iterable, Iterator, List, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # ---------------------------------------------------------------------------
 # 3rd‑party deps (fail‑friendly imports)
@@ -45,29 +75,29 @@ except ImportError as e:  # pragma: no cover
         f"Missing dependency: {missing}.  Install via 'pip install rich typer'."
     )
 
-try:
-    from textual.app import App, ComposeResult
-    from textual.containers import Container, Horizontal
-    from textual.widgets import (
-        Header,
-        Footer,
-        Button,
-        Static,
-        DataTable,
-        Input,
-        Label,
-        Slider,
-    )
-except ImportError:
-    App = None  # fallback so module still loads for Streamlit/CLI
+# matplotlib, textual, numpy and streamlit are imported inside the commands
+# that use them: a quick ``add`` or ``list`` should not pay for loading them.
 
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    raise SystemExit("Install matplotlib: pip install matplotlib")
 
-DB_PATH = Path.home() / ".wellbeing_tracker.db"
+def _pyplot():
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise SystemExit("Install matplotlib: pip install matplotlib")
+    return plt
+
+
+DB_PATH = Path(
+    os.environ.get("BP_TRACKER_DB", Path.home() / ".wellbeing_tracker.db")
+)
 DATE_FMT = "%Y-%m-%d"
+EXPORT_BATCH = 1000
+EXPORT_FORMATS = ("csv", "jsonl", "col")
+PAGE_SIZE = 30
+CACHE_PATCH_MAX = 256  # larger writes reload the series cache instead
+TUI_PAGE = 100  # rows per keyset read in the TUI history
+TUI_WINDOW = 1000  # rows the TUI history keeps loaded at once
+_EPOCH_ORDINAL = _dt.date(1970, 1, 1).toordinal()
 console = Console()
 app = typer.Typer(add_completion=False, pretty_exceptions_show_locals=False)
 
@@ -89,6 +119,237 @@ class Entry:
     def columns(cls) -> Sequence[str]:
         return [f.name for f in fields(cls)]
 
+    @classmethod
+    def types(cls) -> dict[str, str]:
+        return {f.name: str(f.type) for f in fields(cls)}
+
+
+# ---------------------------------------------------------------------------
+# Profiling
+# ---------------------------------------------------------------------------
+#
+# ``--profile`` (or BP_TRACKER_PROFILE) times the main stages and every SQL
+# statement. Stages are functions wrapped in @_profiled; each records calls,
+# total and max time, and how much of that was spent in SQLite, so "SQL vs.
+# row conversion vs. rendering" reads straight off the summary. Connections
+# opened through _sqlite() report each statement via sqlite3's trace
+# callback (which also sees implicit BEGIN/COMMIT and trigger bodies), and
+# their execute and fetch calls are timed per statement. Disabled, the cost
+# is one ``is None`` check per stage.
+#
+# BP_TRACKER_PROFILE=1 prints the summary to stderr at exit; any other value
+# is a path to write it to as JSON.
+
+PROFILE_TOP_SQL = 15  # statements shown in the printed summary
+
+
+class Profiler:
+    """Accumulates stage and SQL timings for one process."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        # name: [calls, total s, max s, SQL s]
+        self.stages: dict[str, list[float]] = {}
+        # statement: [executions, total s, max s]
+        self.sql: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()  # statement in flight, SQL s in stage
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        local = self._local
+        outer_sql = getattr(local, "sql_s", 0.0)
+        local.sql_s = 0.0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            sql_s = local.sql_s
+            local.sql_s = outer_sql + sql_s  # nested stages count towards outer
+            with self._lock:
+                rec = self.stages.setdefault(name, [0, 0.0, 0.0, 0.0])
+                rec[0] += 1
+                rec[1] += elapsed
+                rec[2] = max(rec[2], elapsed)
+                rec[3] += sql_s
+
+    def trace(self, statement: str) -> None:
+        """sqlite3 trace callback: count every statement SQLite starts."""
+        current = getattr(self._local, "statement", None)
+        # Rows of an executemany are filed under the statement as written;
+        # transaction control and trigger bodies ("-- TRIGGER x") stand alone.
+        if current is None or statement.lstrip().upper().startswith(
+            ("BEGIN", "COMMIT", "ROLLBACK", "--")
+        ):
+            current = statement
+        with self._lock:
+            self.sql.setdefault(current, [0, 0.0, 0.0])[0] += 1
+
+    def timed(self, statement: str, fn: Any, *args: Any) -> Any:
+        local = self._local
+        local.statement = statement
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            local.statement = None
+            local.sql_s = getattr(local, "sql_s", 0.0) + elapsed
+            with self._lock:
+                rec = self.sql.setdefault(statement, [0, 0.0, 0.0])
+                rec[1] += elapsed
+                rec[2] = max(rec[2], elapsed)
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            stages = {
+                name: {
+                    "calls": int(calls),
+                    "total_ms": total * 1000,
+                    "max_ms": peak * 1000,
+                    "sql_ms": sql * 1000,
+                }
+                for name, (calls, total, peak, sql) in self.stages.items()
+            }
+            sql = [
+                {
+                    "statement": " ".join(statement.split()),
+                    "executions": int(n),
+                    "total_ms": total * 1000,
+                    "max_ms": peak * 1000,
+                }
+                for statement, (n, total, peak) in self.sql.items()
+            ]
+        sql.sort(key=lambda s: s["total_ms"], reverse=True)
+        return {
+            "wall_ms": (time.perf_counter() - self.started) * 1000,
+            "stages": stages,
+            "sql": sql,
+        }
+
+    def report(self, out: Path | None = None) -> None:
+        """Write the summary to ``out`` as JSON, or print it to stderr."""
+        summary = self.summary()
+        if out is not None:
+            out.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+            return
+        err = Console(stderr=True)
+        tbl = Table(
+            title=f"profile: {summary['wall_ms']:.1f} ms wall",
+            header_style="bold magenta",
+        )
+        for col in ("stage", "calls", "total ms", "max ms", "sql ms", "other ms"):
+            tbl.add_column(col, justify="left" if col == "stage" else "right")
+        for name, s in sorted(
+            summary["stages"].items(), key=lambda kv: kv[1]["total_ms"], reverse=True
+        ):
+            tbl.add_row(
+                name,
+                str(s["calls"]),
+                f"{s['total_ms']:.2f}",
+                f"{s['max_ms']:.2f}",
+                f"{s['sql_ms']:.2f}",
+                f"{s['total_ms'] - s['sql_ms']:.2f}",
+            )
+        err.print(tbl)
+        tbl = Table(title="SQL by total time", header_style="bold magenta")
+        tbl.add_column("statement", no_wrap=True, overflow="ellipsis", max_width=48)
+        for col in ("runs", "total ms", "max ms"):
+            tbl.add_column(col, justify="right")
+        for s in summary["sql"][:PROFILE_TOP_SQL]:
+            tbl.add_row(
+                s["statement"],
+                str(s["executions"]),
+                f"{s['total_ms']:.2f}",
+                f"{s['max_ms']:.2f}",
+            )
+        err.print(tbl)
+
+
+_profiler: Profiler | None = None
+
+
+def enable_profiling(out: Path | None = None) -> Profiler:
+    """Start profiling this process; the summary is reported at exit."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler()
+        atexit.register(_profiler.report, out)
+    return _profiler
+
+
+def _profiled(fn: Any) -> Any:
+    """Time calls to ``fn`` as a stage when profiling is enabled."""
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _profiler is None:
+            return fn(*args, **kwargs)
+        with _profiler.stage(fn.__name__):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+class _ProfiledCursor(sqlite3.Cursor):
+    _statement = ""
+
+    def execute(self, sql: str, parameters: Any = ()) -> _ProfiledCursor:
+        self._statement = sql
+        return _profiler.timed(sql, super().execute, sql, parameters)
+
+    def executemany(self, sql: str, seq: Any) -> _ProfiledCursor:
+        self._statement = sql
+        return _profiler.timed(sql, super().executemany, sql, seq)
+
+    def fetchone(self) -> Any:
+        return _profiler.timed(self._statement, super().fetchone)
+
+    def fetchmany(self, size: int | None = None) -> list[Any]:
+        size = self.arraysize if size is None else size
+        return _profiler.timed(self._statement, super().fetchmany, size)
+
+    def fetchall(self) -> list[Any]:
+        return _profiler.timed(self._statement, super().fetchall)
+
+
+class _ProfiledConnection(sqlite3.Connection):
+    # Connection.execute* don't go through cursor(), so route them here.
+    def cursor(self, factory: Any = _ProfiledCursor) -> Any:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = ()) -> Any:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq: Any) -> Any:
+        return self.cursor().executemany(sql, seq)
+
+
+def _sqlite(path: Path, **kwargs: Any) -> sqlite3.Connection:
+    """``sqlite3.connect``, instrumented when profiling is enabled."""
+    if _profiler is None:
+        return sqlite3.connect(path, **kwargs)
+    conn = sqlite3.connect(path, factory=_ProfiledConnection, **kwargs)
+    conn.set_trace_callback(_profiler.trace)
+    return conn
+
+
+def _profile_from_env() -> Profiler | None:
+    setting = os.environ.get("BP_TRACKER_PROFILE", "")
+    if setting.lower() in ("", "0", "false", "no"):
+        return None
+    return enable_profiling(
+        None if setting.lower() in ("1", "true", "yes") else Path(setting)
+    )
+
+
+# Streamlit re-executes this module on every rerun, which would start a
+# fresh profiler (and atexit hook) each time; the app keeps one in
+# st.cache_resource instead (see _run_streamlit).
+if "streamlit" not in sys.modules:
+    _profile_from_env()
+
 
 # ---------------------------------------------------------------------------
 # DB helpers
@@ -96,7 +357,7 @@ class Entry:
 
 
 def _connect() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+    conn = _sqlite(DB_PATH)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -106,56 +367,1409 @@ def _init_db() -> None:
     if autoinit_done:
         return
     with _connect() as conn:
+        _migrate(conn)
+        _init_data_version(conn)
+        _init_rollups(conn)
+    autoinit_done = True
+
+
+# ---------------------------------------------------------------------------
+# Migrations
+# ---------------------------------------------------------------------------
+#
+# Base tables are created and evolved only by MIGRATIONS; PRAGMA user_version
+# records how many have run. Each step runs in its own IMMEDIATE transaction
+# together with the version bump, so a crash or a concurrent process can
+# never leave a half-migrated file. Derived objects (rollup tables, triggers)
+# are recreated from code by _init_db and may be dropped freely by a step.
+# Append new steps; never edit or reorder released ones.
+
+SCORES = ("mood", "output_quality", "spiritual_depth")  # 1-10 scales
+# julianday() of 1970-01-01, for ISO date -> epoch day in SQL.
+_JULIAN_EPOCH = 2440587.5
+
+
+def _has_table(conn: sqlite3.Connection, name: str) -> bool:
+    return bool(
         conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS metrics (
-                date TEXT PRIMARY KEY,
-                sleep_hours REAL,
-                hrv REAL,
-                typing_variability REAL,
-                speech_rate INTEGER,
-                mood INTEGER,
-                output_quality INTEGER,
-                spiritual_depth INTEGER
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone()
+    )
+
+
+def _migrate_epoch_days(conn: sqlite3.Connection) -> None:
+    """Integer epoch-day key and STRICT tables with range checks.
+
+    ``metrics`` was keyed by an ISO date string (11 bytes a row plus a
+    separate index); keyed by INTEGER day it is a plain rowid table, so
+    pages hold more rows and range scans compare integers.
+    """
+    # Spelled out rather than derived from Entry: a migration must keep
+    # producing the same table however the model grows later.
+    conn.execute(
+        """
+        CREATE TABLE metrics_new (
+            day INTEGER PRIMARY KEY NOT NULL,  -- days since 1970-01-01
+            sleep_hours REAL,
+            hrv REAL,
+            typing_variability REAL,
+            speech_rate INTEGER,
+            mood INTEGER CHECK (mood BETWEEN 1 AND 10),
+            output_quality INTEGER CHECK (output_quality BETWEEN 1 AND 10),
+            spiritual_depth INTEGER CHECK (spiritual_depth BETWEEN 1 AND 10)
+        ) STRICT
+        """
+    )
+    if _has_table(conn, "metrics"):
+        # julianday() is NULL for text it can't parse (and happily reads
+        # 'now'), and NULL into the key would take the next free day. Only
+        # canonical YYYY-MM-DD dates are carried over.
+        bad = [
+            row[0]
+            for row in conn.execute(
+                "SELECT date FROM metrics WHERE date(date) IS NOT date LIMIT 5"
             )
-            """
+        ]
+        if bad:
+            raise sqlite3.IntegrityError(
+                f"metrics has dates that are not YYYY-MM-DD, e.g. {bad!r}"
+            )
+        values = (
+            "sleep_hours, hrv, typing_variability, speech_rate, "
+            "mood, output_quality, spiritual_depth"
         )
-    autoinit_done = True
+        conn.execute(
+            f"INSERT INTO metrics_new (day, {values}) "
+            f"SELECT CAST(julianday(date) - {_JULIAN_EPOCH} AS INTEGER), {values} "
+            "FROM metrics"
+        )
+        conn.execute("DROP TABLE metrics")  # takes its triggers with it
+    conn.execute("ALTER TABLE metrics_new RENAME TO metrics")
+    conn.execute(
+        """
+        CREATE TABLE samples_new (
+            metric INTEGER NOT NULL,
+            ts INTEGER NOT NULL,  -- Unix milliseconds
+            value REAL NOT NULL,
+            PRIMARY KEY (metric, ts)
+        ) STRICT, WITHOUT ROWID
+        """
+    )
+    if _has_table(conn, "samples"):
+        conn.execute("INSERT INTO samples_new SELECT metric, ts, value FROM samples")
+        conn.execute("DROP TABLE samples")
+    conn.execute("ALTER TABLE samples_new RENAME TO samples")
+    # Rollup buckets change type too; _init_rollups rebuilds them.
+    for name in ROLLUPS:
+        conn.execute(f"DROP TABLE IF EXISTS rollup_{name}")
+
+
+MIGRATIONS = (
+    _migrate_epoch_days,  # 1
+)
+
+
+def _user_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Bring the file up to ``len(MIGRATIONS)``, one transaction per step."""
+    while _user_version(conn) < len(MIGRATIONS):
+        conn.commit()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-read under the write lock: another process may have got here first.
+            version = _user_version(conn)
+            if version < len(MIGRATIONS):
+                MIGRATIONS[version](conn)
+                conn.execute(f"PRAGMA user_version = {version + 1}")
+            conn.commit()
+        except sqlite3.IntegrityError as exc:
+            conn.rollback()
+            raise SystemExit(
+                f"Migrating {DB_PATH} to schema {version + 1} failed: {exc}. "
+                "Fix or remove the offending rows and run again."
+            )
+        except BaseException:
+            conn.rollback()
+            raise
+
+
+def _init_data_version(conn: sqlite3.Connection) -> None:
+    # A persistent write counter: unlike PRAGMA data_version it is the same
+    # for every connection and process, so it can key on-disk caches.
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+    conn.execute("INSERT OR IGNORE INTO meta VALUES ('data_version', 0)")
+    for event in ("INSERT", "UPDATE", "DELETE"):
+        conn.execute(
+            f"CREATE TRIGGER IF NOT EXISTS metrics_version_{event.lower()} "
+            f"AFTER {event} ON metrics BEGIN "
+            "UPDATE meta SET value = value + 1 WHERE key = 'data_version'; END"
+        )
+
+
+def data_version() -> int:
+    """Counter bumped by every write to ``metrics``, from any process."""
+    _init_db()
+    with _connect() as conn:
+        return conn.execute(
+            "SELECT value FROM meta WHERE key = 'data_version'"
+        ).fetchone()[0]
+
+
+def _entry_row(e: Entry) -> tuple[Any, ...]:
+    """``e`` as a ``metrics`` row: the ISO date becomes an epoch day."""
+    return (_epoch_day(e.date), *tuple(asdict(e).values())[1:])
+
+
+_UPSERT_ENTRY = (
+    f"INSERT OR REPLACE INTO metrics (day, {', '.join(Entry.columns()[1:])}) "
+    f"VALUES ({', '.join('?' * len(Entry.columns()))})"
+)
 
 
 def add_entry(e: Entry) -> None:
     _init_db()
     with _connect() as conn:
+        conn.execute(_UPSERT_ENTRY, _entry_row(e))
+    _patch_series_cache([e])
+
+
+def add_entries(entries: Iterable[Entry]) -> int:
+    """Insert or replace many entries in a single transaction."""
+    _init_db()
+    # Keep a bounded tail for the series cache; bigger batches just reload it.
+    written: collections.deque[Entry] = collections.deque(maxlen=CACHE_PATCH_MAX + 1)
+
+    def rows() -> Iterator[tuple[Any, ...]]:
+        for e in entries:
+            written.append(e)
+            yield _entry_row(e)
+
+    with _connect() as conn:
+        cur = conn.executemany(_UPSERT_ENTRY, rows())
+        n = cur.rowcount
+    _patch_series_cache(list(written) if n <= CACHE_PATCH_MAX else None)
+    return n
+
+
+# ---------------------------------------------------------------------------
+# Rollups
+# ---------------------------------------------------------------------------
+#
+# rollup_week / rollup_month hold mean, min, max and count per metric for each
+# calendar week (starting Monday) and month, keyed by the epoch day the
+# period starts on. Triggers on ``metrics`` recompute just the bucket a
+# written row falls in, so every writer keeps them current and each write
+# costs at most one month scan.
+
+ROLLUPS: dict[str, tuple[str, str]] = {
+    # name: (SQL for the bucket holding epoch day {d}, first day after bucket {b})
+    # Day 0 was a Thursday; "% 7 + 10" keeps the weekday right for negative days.
+    "week": ("({d} - ({d} % 7 + 10) % 7)", "({b} + 7)"),
+    "month": (
+        f"CAST(julianday({{d}} * 86400, 'unixepoch', 'start of month')"
+        f" - {_JULIAN_EPOCH} AS INTEGER)",
+        f"CAST(julianday({{b}} * 86400, 'unixepoch', '+1 month')"
+        f" - {_JULIAN_EPOCH} AS INTEGER)",
+    ),
+}
+RESOLUTIONS = ("auto", "day", *ROLLUPS)
+# Ranges longer than this many days are charted from the given rollup.
+ROLLUP_AFTER_DAYS = (("month", 3 * 365), ("week", 180))
+
+
+def _rollup_metrics() -> Sequence[str]:
+    return Entry.columns()[1:]
+
+
+def _rollup_select(expr: str) -> str:
+    aggs = ", ".join(
+        f"AVG({m}), MIN({m}), MAX({m}), COUNT({m})" for m in _rollup_metrics()
+    )
+    return f"SELECT {expr}, COUNT(*), {aggs} FROM metrics"
+
+
+def _rollup_refresh_sql(name: str, ref: str) -> str:
+    """Statements rebuilding the ``name`` bucket that row ``ref`` belongs to."""
+    bucket_expr, end_expr = ROLLUPS[name]
+    bucket = bucket_expr.format(d=f"{ref}.day")
+    return (
+        f"DELETE FROM rollup_{name} WHERE bucket = {bucket};\n"
+        f"INSERT INTO rollup_{name} {_rollup_select(bucket)}"
+        f" WHERE day >= {bucket} AND day < {end_expr.format(b=bucket)}"
+        " HAVING COUNT(*) > 0;"
+    )
+
+
+def _init_rollups(conn: sqlite3.Connection) -> None:
+    fresh = not conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'rollup_month'"
+    ).fetchone()
+    cols = ", ".join(
+        f"{m}_mean REAL, {m}_min REAL, {m}_max REAL, {m}_count INTEGER"
+        for m in _rollup_metrics()
+    )
+    for name in ROLLUPS:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS rollup_{name} "
+            f"(bucket INTEGER PRIMARY KEY, days INTEGER, {cols}) STRICT"
+        )
+    for event, refs in (
+        ("INSERT", ("NEW",)),
+        ("DELETE", ("OLD",)),
+        ("UPDATE", ("OLD", "NEW")),
+    ):
+        body = "\n".join(_rollup_refresh_sql(n, r) for r in refs for n in ROLLUPS)
         conn.execute(
-            f"INSERT OR REPLACE INTO metrics ({', '.join(Entry.columns())}) VALUES (?,?,?,?,?,?,?,?)",
-            tuple(asdict(e).values()),
+            f"CREATE TRIGGER IF NOT EXISTS metrics_rollup_{event.lower()} "
+            f"AFTER {event} ON metrics BEGIN\n{body}\nEND"
         )
+    if fresh:
+        _rebuild_rollups(conn)
 
 
-def fetch_entries(days: int | None = None) -> List[sqlite3.Row]:
+def _rebuild_rollups(conn: sqlite3.Connection) -> None:
+    for name, (bucket_expr, _) in ROLLUPS.items():
+        bucket = bucket_expr.format(d="day")
+        conn.execute(f"DELETE FROM rollup_{name}")
+        conn.execute(
+            f"INSERT INTO rollup_{name} {_rollup_select(bucket)} GROUP BY 1"
+        )
+
+
+def rebuild_rollups() -> None:
+    """Recompute every rollup bucket from ``metrics``."""
     _init_db()
-    q = "SELECT * FROM metrics ORDER BY date DESC"
+    with _connect() as conn:
+        _rebuild_rollups(conn)
+
+
+def _resolve_resolution(resolution: str, days: int | None) -> str:
+    if resolution != "auto":
+        return resolution
+    if days is None:
+        _init_db()
+        with _connect() as conn:
+            first, last = conn.execute(
+                "SELECT MIN(day), MAX(day) FROM metrics"
+            ).fetchone()
+        if first is None:
+            return "day"
+        days = last - first
+    for name, threshold in ROLLUP_AFTER_DAYS:
+        if days > threshold:
+            return name
+    return "day"
+
+
+@_profiled
+def fetch_trend(
+    metric: str, days: int | None = None, resolution: str = "auto"
+) -> tuple[str, list[tuple[str, float]]]:
+    """Series for ``metric`` at ``resolution`` (day, week, month or auto).
+
+    Weekly and monthly series are bucket means read from the rollup tables,
+    so long ranges cost one row per bucket rather than one per day. ``auto``
+    picks the coarsest resolution in :data:`ROLLUP_AFTER_DAYS` that the range
+    exceeds. Returns the resolution used alongside the ``(date, value)`` rows.
+    """
+    if metric not in _rollup_metrics():
+        raise ValueError(f"Unknown metric: {metric}")
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution: {resolution}")
+    resolution = _resolve_resolution(resolution, days)
+    if resolution == "day":
+        return resolution, fetch_series(metric, days)
+    q = f"SELECT {_ISO_DATE.format(d='bucket')}, {metric}_mean FROM rollup_{resolution}"
     params: tuple[Any, ...] = ()
     if days is not None:
-        start = (_dt.date.today() - _dt.timedelta(days=days)).strftime(DATE_FMT)
-        q += " WHERE date >= ?"
-        params = (start,)
+        bucket_expr, _ = ROLLUPS[resolution]
+        q += f" WHERE bucket >= {bucket_expr.format(d='?')}"
+        params = (_epoch_day(_days_ago(days)),) * bucket_expr.count("{d}")
+    _init_db()
     with _connect() as conn:
-        return conn.execute(q, params).fetchall()
+        return resolution, conn.execute(q + " ORDER BY bucket", params).fetchall()
 
 
+@dataclass(slots=True)
+class Page:
+    """One keyset page of :func:`query_entries` results."""
+
+    rows: List[sqlite3.Row]
+    next_cursor: str | None  # pass as ``after`` to read the following page
+
+
+def _epoch_day(date: str) -> int:
+    return _dt.date.fromisoformat(date).toordinal() - _EPOCH_ORDINAL
+
+
+# ``metrics`` stores epoch days; rows leave the query layer with ISO dates.
+_ISO_DATE = "date({d} * 86400, 'unixepoch')"
+
+
+def _sql_columns(columns: Sequence[str], epoch_days: bool = False) -> str:
+    return ", ".join(
+        ("day" if epoch_days else f"{_ISO_DATE.format(d='day')} AS date")
+        if c == "date"
+        else c
+        for c in columns
+    )
+
+
+def _days_ago(days: int) -> str:
+    return (_dt.date.today() - _dt.timedelta(days=days)).strftime(DATE_FMT)
+
+
+def _select_columns(columns: Sequence[str] | None) -> list[str]:
+    cols = list(columns) if columns else list(Entry.columns())
+    unknown = set(cols) - set(Entry.columns())
+    if unknown:
+        raise ValueError(f"Unknown column(s): {', '.join(sorted(unknown))}")
+    return cols
+
+
+def _range_clause(
+    start: str | None,
+    end: str | None,
+    after: str | None = None,
+    descending: bool = False,
+) -> tuple[str, list[Any]]:
+    """Build the ``WHERE`` clause for a date range plus an optional keyset cursor."""
+    where: list[str] = []
+    params: list[Any] = []
+    if start is not None:
+        where.append("day >= ?")
+        params.append(_epoch_day(start))
+    if end is not None:
+        where.append("day <= ?")
+        params.append(_epoch_day(end))
+    if after is not None:
+        where.append("day < ?" if descending else "day > ?")
+        params.append(_epoch_day(after))
+    return (" WHERE " + " AND ".join(where) if where else ""), params
+
+
+@_profiled
+def query_entries(
+    start: str | None = None,
+    end: str | None = None,
+    metrics: Sequence[str] | None = None,
+    limit: int | None = None,
+    after: str | None = None,
+    descending: bool = True,
+) -> Page:
+    """Read entries in ``[start, end]``, newest first unless ``descending=False``.
+
+    ``metrics`` projects the result down to ``date`` plus the named columns.
+    With a ``limit`` the result is paged by keyset on the ``day`` primary key:
+    feed ``next_cursor`` back in as ``after`` and every page is a single index
+    seek, no matter how deep into history it starts.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    cols = _select_columns(
+        ["date", *(m for m in metrics if m != "date")] if metrics else None
+    )
+    clause, params = _range_clause(start, end, after, descending)
+    q = f"SELECT {_sql_columns(cols)} FROM metrics{clause} ORDER BY day"
+    if descending:
+        q += " DESC"
+    if limit is not None:
+        q += " LIMIT ?"
+        params.append(limit + 1)
+    _init_db()
+    with _connect() as conn:
+        rows = conn.execute(q, params).fetchall()
+    if limit is not None and len(rows) > limit:
+        del rows[limit:]
+        return Page(rows, rows[-1]["date"])
+    return Page(rows, None)
+
+
+@_profiled
+def fetch_entries(days: int | None = None) -> List[sqlite3.Row]:
+    start = _days_ago(days) if days is not None else None
+    return query_entries(start=start).rows
+
+
+@_profiled
 def fetch_series(metric: str, days: int | None = None) -> list[tuple[str, float]]:
     if metric not in Entry.columns()[1:]:
         raise ValueError(f"Unknown metric: {metric}")
+    start = _days_ago(days) if days is not None else None
+    return query_entries(start=start, metrics=[metric], descending=False).rows
+
+
+def iter_batches(
+    start: str | None = None,
+    end: str | None = None,
+    columns: Sequence[str] | None = None,
+    batch_size: int = EXPORT_BATCH,
+    epoch_days: bool = False,
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Yield rows oldest-first as plain tuples, ``batch_size`` at a time.
+
+    Rows come straight off the cursor via ``fetchmany`` so at most one batch
+    is held in memory, however large the date range. ``epoch_days`` leaves
+    the date column as stored, in days since 1970-01-01.
+    """
+    cols = _select_columns(columns)
+    _init_db()
+    clause, params = _range_clause(start, end)
+    q = f"SELECT {_sql_columns(cols, epoch_days)} FROM metrics{clause} ORDER BY day"
+    conn = _connect()
+    try:
+        cur = conn.cursor()
+        cur.row_factory = None
+        cur.arraysize = batch_size
+        cur.execute(q, params)
+        while batch := cur.fetchmany():
+            yield batch
+    finally:
+        conn.close()
+
+
+def iter_entries(
+    start: str | None = None,
+    end: str | None = None,
+    columns: Sequence[str] | None = None,
+    batch_size: int = EXPORT_BATCH,
+) -> Iterator[tuple[Any, ...]]:
+    """Row-at-a-time view over :func:`iter_batches`."""
+    for batch in iter_batches(start, end, columns, batch_size):
+        yield from batch
+
+
+# ---------------------------------------------------------------------------
+# Series cache
+# ---------------------------------------------------------------------------
+
+
+class SeriesCache:
+    """Process-wide columnar copy of ``metrics``: one flat buffer per column.
+
+    ``dates`` is an ``array('i')`` of epoch days in ascending order and every
+    metric an aligned ``array('d')`` (NULL as NaN), about 70 bytes per day in
+    total. Ranges come back as memoryviews over those buffers, so slicing
+    copies nothing and NumPy can wrap them with ``np.frombuffer``.
+
+    add_entry/add_entries patch the buffers after their own writes: values
+    for an existing day are overwritten in place, while a new day builds
+    fresh buffers so that views already handed out stay valid. Writes by
+    anyone else change ``PRAGMA data_version`` on the cache's connection and
+    cause a full reload on the next read.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn = _sqlite(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._pragma: int | None = None  # PRAGMA data_version when synced
+        self._counter = 0  # data_version() counter when synced
+        self.dates = array("i")
+        self.columns: dict[str, array] = {}
+
+    def _pragma_version(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _load(self) -> None:
+        pragma = self._pragma_version()
+        metrics = _rollup_metrics()
+        dates = array("i")
+        columns = {m: array("d") for m in metrics}
+        cur = self._conn.cursor()
+        cur.arraysize = EXPORT_BATCH
+        cur.execute("BEGIN")
+        try:
+            (counter,) = cur.execute(
+                "SELECT value FROM meta WHERE key = 'data_version'"
+            ).fetchone()
+            cur.execute(f"SELECT day, {', '.join(metrics)} FROM metrics ORDER BY day")
+            while batch := cur.fetchmany():
+                dates.extend(r[0] for r in batch)
+                for i, m in enumerate(metrics, start=1):
+                    columns[m].extend(
+                        math.nan if r[i] is None else r[i] for r in batch
+                    )
+        finally:
+            cur.execute("COMMIT")
+        self.dates, self.columns = dates, columns
+        self._pragma, self._counter = pragma, counter
+
+    def _fresh(self) -> None:
+        if self._pragma is None or self._pragma_version() != self._pragma:
+            self._load()
+
+    def _bounds(self, start: str | None, end: str | None) -> tuple[int, int]:
+        lo = bisect.bisect_left(self.dates, _epoch_day(start)) if start else 0
+        hi = (
+            bisect.bisect_right(self.dates, _epoch_day(end))
+            if end
+            else len(self.dates)
+        )
+        return lo, hi
+
+    def series(
+        self, metric: str, start: str | None = None, end: str | None = None
+    ) -> tuple[memoryview, memoryview]:
+        """Zero-copy ``(epoch days, values)`` views for ``[start, end]``."""
+        dates, (values,) = self.frame([metric], start, end)
+        return dates, values
+
+    def frame(
+        self, metrics: Sequence[str], start: str | None = None, end: str | None = None
+    ) -> tuple[memoryview, list[memoryview]]:
+        """Like :meth:`series` for several metrics, all from one snapshot."""
+        unknown = set(metrics) - set(_rollup_metrics())
+        if unknown:
+            raise ValueError(f"Unknown metric(s): {', '.join(sorted(unknown))}")
+        with self._lock:
+            self._fresh()
+            lo, hi = self._bounds(start, end)
+            return (
+                memoryview(self.dates)[lo:hi],
+                [memoryview(self.columns[m])[lo:hi] for m in metrics],
+            )
+
+    def patch(self, entries: Sequence[Entry]) -> None:
+        """Apply entries this process has just written to ``metrics``."""
+        with self._lock:
+            if self._pragma is None:
+                return  # not loaded yet; the first read loads everything
+            # Pragma before counter, as in _load: a commit landing between
+            # the two reads then shows up as a changed pragma next time.
+            pragma = self._pragma_version()
+            (counter,) = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'data_version'"
+            ).fetchone()
+            # Each upsert bumps the counter once. Anything else means another
+            # writer got in as well, and only a reload is safe.
+            if counter != self._counter + len(entries):
+                self._pragma = None
+                return
+            try:
+                rows = [
+                    (
+                        _epoch_day(e.date),
+                        [math.nan if v is None else float(v) for v in values[1:]],
+                    )
+                    for e in entries
+                    for values in [list(asdict(e).values())]
+                ]
+            except (TypeError, ValueError):
+                # Not plain numbers (SQLite converted them on the way in).
+                self._pragma = None
+                return
+            for day, values in rows:
+                self._patch_one(day, values)
+            self._pragma, self._counter = pragma, counter
+
+    def invalidate(self) -> None:
+        """Drop the buffers; the next read reloads them."""
+        with self._lock:
+            self._pragma = None
+
+    def _patch_one(self, day: int, values: list[float]) -> None:
+        i = bisect.bisect_left(self.dates, day)
+        if i < len(self.dates) and self.dates[i] == day:
+            for m, v in zip(_rollup_metrics(), values):
+                self.columns[m][i] = v
+            return
+        # Views may be holding the old buffers (which then can't be resized),
+        # so splice into new ones.
+        self.dates = self.dates[:i] + array("i", [day]) + self.dates[i:]
+        for m, v in zip(_rollup_metrics(), values):
+            col = self.columns[m]
+            self.columns[m] = col[:i] + array("d", [v]) + col[i:]
+
+
+_series_cache: SeriesCache | None = None
+
+
+def series_cache() -> SeriesCache:
+    """The process-wide :class:`SeriesCache` for :data:`DB_PATH`."""
+    global _series_cache
+    if _series_cache is None or _series_cache.path != DB_PATH:
+        _init_db()
+        _series_cache = SeriesCache(DB_PATH)
+    return _series_cache
+
+
+def _patch_series_cache(entries: Sequence[Entry] | None) -> None:
+    """Tell the series cache about our own writes (None: too many to patch)."""
+    if _series_cache is None or _series_cache.path != DB_PATH:
+        return
+    if entries is None:
+        _series_cache.invalidate()
+    else:
+        _series_cache.patch(entries)
+
+
+# ---------------------------------------------------------------------------
+# Samples
+# ---------------------------------------------------------------------------
+#
+# Raw sensor readings (HRV straps, keystroke loggers, speech meters) live in
+# ``samples``: one row per reading, keyed by (metric id, Unix milliseconds).
+# As a WITHOUT ROWID table the rows are stored in that key's B-tree itself,
+# about 20 bytes each, and a metric's readings over a day are one range scan.
+# The daily ``metrics`` values are derived from them by downsample_samples.
+
+SAMPLE_METRICS: dict[str, tuple[int, str]] = {
+    # metric: (id stored in samples.metric - never renumber, daily aggregate)
+    "hrv": (1, "mean"),  # RMSSD readings
+    "typing_variability": (2, "std"),  # inter-key intervals in ms
+    "speech_rate": (3, "mean"),  # words-per-minute readings
+}
+SAMPLE_BATCH = 50_000  # samples per insert transaction
+SAMPLE_FLUSH_SECS = 1.0  # flush a part-filled batch after this long
+SAMPLE_TS_RANGE = (  # accepted timestamps, Unix ms: 1970 up to 9000
+    0,
+    int(_dt.datetime(9000, 1, 1, tzinfo=_dt.timezone.utc).timestamp() * 1000),
+)
+_DAY_MS = 86_400_000
+
+
+def _sample_metric_id(metric: str) -> int:
+    try:
+        return SAMPLE_METRICS[metric][0]
+    except KeyError:
+        raise ValueError(
+            f"Unknown sample metric {metric!r}; expected one of "
+            f"{', '.join(SAMPLE_METRICS)}"
+        ) from None
+
+
+def _sample_ts(ts: int | float | str) -> int:
+    """Unix milliseconds from a number or an ISO 8601 string (naive = local).
+
+    Raises ValueError for anything outside :data:`SAMPLE_TS_RANGE`, which
+    keeps every stored timestamp convertible to a calendar day.
+    """
+    if isinstance(ts, bool):
+        raise ValueError(f"Bad sample timestamp {ts!r}")
+    try:
+        if isinstance(ts, str) and not ts.lstrip("-").isdigit():
+            ms = int(_dt.datetime.fromisoformat(ts).timestamp() * 1000)
+        else:
+            ms = int(ts)
+    except (TypeError, OverflowError):
+        raise ValueError(f"Bad sample timestamp {ts!r}") from None
+    if not SAMPLE_TS_RANGE[0] <= ms < SAMPLE_TS_RANGE[1]:
+        raise ValueError(f"Sample timestamp {ts!r} is outside 1970-9000")
+    return ms
+
+
+def _sample_value(value: Any) -> float:
+    """A finite float, or ValueError (SQLite would store NaN as NULL)."""
+    if isinstance(value, bool):
+        raise ValueError(f"Bad sample value {value!r}")
+    try:
+        v = float(value)
+    except TypeError:
+        raise ValueError(f"Bad sample value {value!r}") from None
+    if not math.isfinite(v):
+        raise ValueError(f"Sample value must be finite, got {value!r}")
+    return v
+
+
+def _day_start_ms(date: str | _dt.date) -> int:
+    """Unix milliseconds of local midnight at the start of ``date``."""
+    if isinstance(date, str):
+        date = _dt.date.fromisoformat(date)
+    return int(_dt.datetime.combine(date, _dt.time()).timestamp() * 1000)
+
+
+def _ms_date(ts: int) -> _dt.date:
+    return _dt.datetime.fromtimestamp(ts / 1000).date()
+
+
+class SampleWriter:
+    """Buffered writer for ``samples``.
+
+    Readings collect in memory and go to SQLite in one ``executemany`` and
+    one transaction per ``batch_size`` samples (or per ``flush_interval``
+    seconds, whichever comes first), so commit cost is paid per batch rather
+    than per reading. Re-sending a reading for the same metric and
+    millisecond replaces it. Use it as a context manager so the last part
+    batch is flushed.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        batch_size: int = SAMPLE_BATCH,
+        flush_interval: float = SAMPLE_FLUSH_SECS,
+    ) -> None:
+        _init_db()
+        self._conn = _sqlite(path or DB_PATH, check_same_thread=False)
+        # WAL keeps readers going while a batch commits, and synchronous=NORMAL
+        # syncs at checkpoints instead of on every commit.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buf: list[tuple[int, int, float]] = []
+        self._flushed_at = time.monotonic()
+        self.written = 0
+        self.span: tuple[int, int] | None = None  # min/max ts written so far
+
+    def add(self, metric: str, ts: int | float | str, value: float) -> None:
+        """Buffer one reading; raises ValueError if it can't be stored."""
+        self._buf.append(
+            (_sample_metric_id(metric), _sample_ts(ts), _sample_value(value))
+        )
+        if (
+            len(self._buf) >= self.batch_size
+            or time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            self.flush()
+
+    def extend(self, samples: Iterable[tuple[str, int | float | str, float]]) -> None:
+        for metric, ts, value in samples:
+            self.add(metric, ts, value)
+
+    def flush(self) -> int:
+        """Write the buffered samples in one transaction; returns how many."""
+        buf, self._buf = self._buf, []
+        self._flushed_at = time.monotonic()
+        if not buf:
+            return 0
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO samples VALUES (?, ?, ?)", buf)
+        lo = min(r[1] for r in buf)
+        hi = max(r[1] for r in buf)
+        if self.span is not None:
+            lo, hi = min(lo, self.span[0]), max(hi, self.span[1])
+        self.span = (lo, hi)
+        self.written += len(buf)
+        return len(buf)
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> SampleWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _sample_span(conn: sqlite3.Connection) -> tuple[int, int] | None:
+    """First and last sample timestamp over all metrics, via the primary key."""
+    lo: list[int] = []
+    hi: list[int] = []
+    for mid, _ in SAMPLE_METRICS.values():
+        # One MIN or MAX per statement so SQLite can answer from the index.
+        (first,) = conn.execute(
+            "SELECT MIN(ts) FROM samples WHERE metric = ?", (mid,)
+        ).fetchone()
+        if first is None:
+            continue
+        (last,) = conn.execute(
+            "SELECT MAX(ts) FROM samples WHERE metric = ?", (mid,)
+        ).fetchone()
+        lo.append(first)
+        hi.append(last)
+    return (min(lo), max(hi)) if lo else None
+
+
+def _aggregate(kind: str, n: int, total: float, squares: float) -> float | None:
+    if kind == "mean":
+        return total / n
+    if n < 2:
+        return None
+    return math.sqrt(max(squares - total * total / n, 0.0) / (n - 1))
+
+
+def downsample_samples(start: str | None = None, end: str | None = None) -> int:
+    """Derive daily hrv, typing_variability and speech_rate from ``samples``.
+
+    Each local day in ``[start, end]`` (default: every day with samples) that
+    has readings gets those columns upserted into ``metrics``; the other
+    columns of an existing entry are left alone. Returns the number of days
+    written.
+    """
     _init_db()
-    q = f"SELECT date, {metric} FROM metrics ORDER BY date"
-    params: tuple[Any, ...] = ()
-    if days is not None:
-        start = (_dt.date.today() - _dt.timedelta(days=days)).strftime(DATE_FMT)
-        q = f"SELECT date, {metric} FROM metrics WHERE date >= ? ORDER BY date"
-        params = (start,)
     with _connect() as conn:
-        return conn.execute(q, params).fetchall()
+        if start is None or end is None:
+            span = _sample_span(conn)
+            if span is None:
+                return 0
+            first = _dt.date.fromisoformat(start) if start else _ms_date(span[0])
+            last = _dt.date.fromisoformat(end) if end else _ms_date(span[1])
+        else:
+            first, last = _dt.date.fromisoformat(start), _dt.date.fromisoformat(end)
+        days: set[str] = set()
+        for metric, (mid, kind) in SAMPLE_METRICS.items():
+            rows: list[tuple[str, float]] = []
+            day = first
+            lo = _day_start_ms(day)
+            while day <= last:
+                nxt = day + _dt.timedelta(days=1)
+                hi = _day_start_ms(nxt)
+                n, total, squares = conn.execute(
+                    "SELECT COUNT(*), TOTAL(value), TOTAL(value * value) "
+                    "FROM samples WHERE metric = ? AND ts >= ? AND ts < ?",
+                    (mid, lo, hi),
+                ).fetchone()
+                value = _aggregate(kind, n, total, squares) if n else None
+                if value is not None:
+                    if Entry.types()[metric] == "int":
+                        value = round(value)
+                    rows.append((day.toordinal() - _EPOCH_ORDINAL, value))
+                day, lo = nxt, hi
+            conn.executemany(
+                f"INSERT INTO metrics (day, {metric}) VALUES (?, ?) "
+                f"ON CONFLICT(day) DO UPDATE SET {metric} = excluded.{metric}",
+                rows,
+            )
+            days.update(d for d, _ in rows)
+    if days:
+        _patch_series_cache(None)
+    return len(days)
+
+
+# ---------------------------------------------------------------------------
+# Ingest daemon
+# ---------------------------------------------------------------------------
+#
+# ``serve`` keeps one process (imports, connections) warm and accepts JSON
+# records over a Unix socket (one record per line) or localhost HTTP (POST a
+# record, an array or JSON lines). A record with a "date" is a full Entry;
+# one with "metric", "ts" and "value" is a sample. Request threads only parse
+# and enqueue, and a single writer thread drains the queue in timed batches,
+# so SQLite sees one writer and one transaction per batch.
+
+SERVE_QUEUE = 100_000  # records; a full queue blocks clients (backpressure)
+SERVE_BATCH_SECS = 0.25  # a batch closes this long after its first record
+SERVE_DOWNSAMPLE_SECS = 60.0  # how often sampled days are re-derived
+_SERVE_STOP = object()
+
+
+_SQLITE_INT_MIN, _SQLITE_INT_MAX = -(2**63), 2**63 - 1
+
+
+def _check_entry(entry: Entry) -> Entry:
+    """Hold every field to the STRICT schema; integral floats become ints.
+
+    The writer thread inserts a batch in one transaction, so a value SQLite
+    would reject has to be caught here or it fails the whole batch.
+    """
+    if not isinstance(entry.date, str):
+        raise ValueError(f"date must be a YYYY-MM-DD string, got {entry.date!r}")
+    _dt.date.fromisoformat(entry.date)
+    for name, kind in list(Entry.types().items())[1:]:
+        value = getattr(entry, name)
+        if value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} must be a number, got {value!r}")
+        if isinstance(value, int) and not _SQLITE_INT_MIN <= value <= _SQLITE_INT_MAX:
+            raise ValueError(f"{name} is out of range, got {value!r}")
+        if kind == "int":
+            if isinstance(value, float) and not value.is_integer():
+                raise ValueError(f"{name} must be a whole number, got {value!r}")
+            setattr(entry, name, int(value))
+    for name in SCORES:
+        value = getattr(entry, name)
+        if value is not None and not 1 <= value <= 10:
+            raise ValueError(f"{name} must be between 1 and 10, got {value!r}")
+    return entry
+
+
+def _parse_record(rec: Any) -> Entry | tuple[str, int, float]:
+    """Validate one JSON record; every failure is a ValueError."""
+    if not isinstance(rec, dict):
+        raise ValueError(f"Expected a JSON object, got {type(rec).__name__}")
+    try:
+        if "date" in rec:
+            try:
+                entry = Entry(**rec)
+            except TypeError as exc:
+                raise ValueError(f"Not a full entry record: {exc}") from None
+            return _check_entry(entry)
+        try:
+            metric, ts, value = rec["metric"], rec["ts"], rec["value"]
+        except KeyError as exc:
+            raise ValueError(f"Sample record is missing {exc}") from None
+        _sample_metric_id(metric)
+        return metric, _sample_ts(ts), _sample_value(value)
+    except (TypeError, OverflowError) as exc:
+        # Wrong JSON types (a number for a date, null for a value, ...).
+        raise ValueError(f"Bad field type: {exc}") from None
+
+
+class IngestQueue:
+    """Bounded queue plus the single writer thread behind ``serve``."""
+
+    def __init__(
+        self,
+        batch_secs: float = SERVE_BATCH_SECS,
+        downsample_secs: float = SERVE_DOWNSAMPLE_SECS,
+        maxsize: int = SERVE_QUEUE,
+    ) -> None:
+        self.batch_secs = batch_secs
+        self.downsample_secs = downsample_secs
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, name="bp-writer", daemon=True)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._counts = collections.Counter()
+        self._max_depth = 0
+        self._last_batch: dict[str, float] = {}
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def put(self, rec: Any) -> None:
+        """Validate one record and queue it; raises ValueError if it is bad."""
+        self.put_many([rec])
+
+    def put_many(self, recs: Sequence[Any]) -> None:
+        """Validate all of ``recs``, then queue them; all or nothing."""
+        try:
+            items = [_parse_record(rec) for rec in recs]
+        except ValueError:
+            with self._lock:
+                self._counts["rejected"] += 1
+            raise
+        for item in items:
+            self._queue.put(item)
+        depth = self._queue.qsize()
+        with self._lock:
+            self._counts["received"] += len(items)
+            self._max_depth = max(self._max_depth, depth)
+
+    def stop(self) -> None:
+        """Write everything still queued, then end the writer thread."""
+        self._queue.put(_SERVE_STOP)
+        self._thread.join()
+
+    def stats(self) -> dict[str, Any]:
+        uptime = time.monotonic() - self._started
+        with self._lock:
+            counts = dict(self._counts)
+            written = counts.get("entries", 0) + counts.get("samples", 0)
+            return {
+                "uptime_s": round(uptime, 3),
+                "received": counts.get("received", 0),
+                "rejected": counts.get("rejected", 0),
+                "written_entries": counts.get("entries", 0),
+                "written_samples": counts.get("samples", 0),
+                "write_errors": counts.get("errors", 0),
+                "batches": counts.get("batches", 0),
+                "records_per_s": round(written / uptime, 1) if uptime else 0.0,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self._max_depth,
+                "last_batch": dict(self._last_batch),
+            }
+
+    def _run(self) -> None:
+        downsampled_at = time.monotonic()
+        with SampleWriter(flush_interval=math.inf) as writer:
+            stopping = False
+            while not stopping:
+                try:
+                    first = self._queue.get(timeout=self.batch_secs)
+                except queue.Empty:
+                    first = None
+                batch: list[Any] = []
+                if first is _SERVE_STOP:
+                    stopping = True
+                elif first is not None:
+                    batch.append(first)
+                    deadline = time.monotonic() + self.batch_secs
+                    while (left := deadline - time.monotonic()) > 0:
+                        try:
+                            item = self._queue.get(timeout=left)
+                        except queue.Empty:
+                            break
+                        if item is _SERVE_STOP:
+                            stopping = True
+                            break
+                        batch.append(item)
+                if batch:
+                    self._guard(self._write, batch, writer)
+                if writer.span and (
+                    stopping or time.monotonic() - downsampled_at >= self.downsample_secs
+                ):
+                    self._guard(self._downsample, writer.span)
+                    writer.span = None
+                    downsampled_at = time.monotonic()
+
+    def _downsample(self, span: tuple[int, int]) -> None:
+        lo, hi = (_ms_date(ts).strftime(DATE_FMT) for ts in span)
+        downsample_samples(lo, hi)
+
+    def _write(self, batch: list[Any], writer: SampleWriter) -> None:
+        t0 = time.perf_counter()
+        entries = [x for x in batch if isinstance(x, Entry)]
+        samples = [x for x in batch if not isinstance(x, Entry)]
+        entries_ok = not entries or self._guard(add_entries, entries)
+        if samples:
+            writer.extend(samples)
+        samples_ok = not samples or self._guard(writer.flush)
+        with self._lock:
+            self._counts["batches"] += 1
+            if entries_ok:
+                self._counts["entries"] += len(entries)
+            if samples_ok:
+                self._counts["samples"] += len(samples)
+            self._last_batch = {
+                "records": len(batch),
+                "ms": round((time.perf_counter() - t0) * 1000, 3),
+            }
+
+    def _guard(self, fn: Any, *args: Any) -> bool:
+        # A failed batch is reported and dropped; the writer thread is the
+        # only one there is, so nothing may escape and end it.
+        try:
+            fn(*args)
+        except Exception as exc:
+            with self._lock:
+                self._counts["errors"] += 1
+            console.print(f"[red]Write failed: {exc}[/red]")
+            return False
+        return True
+
+
+def _json_records(data: bytes) -> list[Any]:
+    """A JSON object or array, or JSON lines."""
+    try:
+        doc = json.loads(data)
+    except ValueError:
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+    return doc if isinstance(doc, list) else [doc]
+
+
+def _unix_server(path: Path, ingest: IngestQueue):
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        # Records get no reply, so a client pays one write per record.
+        # Errors come back as a JSON line, as does {"op": "stats"}.
+        def handle(self) -> None:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                try:
+                    rec = json.loads(line)
+                    if isinstance(rec, dict) and rec.get("op") == "stats":
+                        self._reply(ingest.stats())
+                    else:
+                        ingest.put(rec)
+                except ValueError as exc:
+                    self._reply({"error": str(exc)})
+
+        def _reply(self, doc: dict[str, Any]) -> None:
+            self.wfile.write(json.dumps(doc).encode() + b"\n")
+
+    path.unlink(missing_ok=True)  # stale socket from an unclean exit
+    server = socketserver.ThreadingUnixStreamServer(str(path), Handler)
+    server.daemon_threads = True
+    path.chmod(0o600)
+    return server
+
+
+def _http_server(port: int, ingest: IngestQueue):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.rstrip("/") == "/stats":
+                self._reply(200, ingest.stats())
+            else:
+                self._reply(404, {"error": "GET /stats, or POST records to /"})
+
+        def do_POST(self) -> None:
+            header = self.headers.get("Content-Length", "0")
+            length = int(header) if header.isdigit() else -1
+            if length < 0:
+                self._reply(400, {"error": f"Bad Content-Length: {header!r}"})
+                return
+            body = self.rfile.read(length)
+            try:
+                # Validate the whole request before queueing any of it, so a
+                # 400 always means nothing was accepted.
+                records = _json_records(body)
+                ingest.put_many(records)
+            except ValueError as exc:
+                self._reply(400, {"error": str(exc)})
+                return
+            self._reply(202, {"accepted": len(records)})
+
+        def _reply(self, status: int, doc: dict[str, Any]) -> None:
+            payload = json.dumps(doc).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass  # one line per record would swamp the terminal
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+#
+# The "col" format is a small columnar container so that large exports can be
+# loaded straight into ``array``/NumPy buffers:
+#
+#   magic  b"BPCOL1\n"
+#   header uint32 length + UTF-8 JSON {"columns": [...], "types": [...]}
+#   blocks uint32 row count, then one little-endian array per column;
+#          a zero row count ends the stream.
+#
+# Types: "date" is int32 days since 1970-01-01, "f8" is float64 (NULL → NaN),
+# "i4" is int32 (NULL → COL_INT_NULL).
+
+COL_MAGIC = b"BPCOL1\n"
+COL_INT_NULL = -(2**31)
+_COL_TYPECODES = {"date": "i", "f8": "d", "i4": "i"}
+
+
+def _col_type(column: str) -> str:
+    if column == "date":
+        return "date"
+    return "f8" if Entry.types()[column] == "float" else "i4"
+
+
+def _write_csv(
+    batches: Iterator[list[tuple[Any, ...]]], columns: Sequence[str], fh: IO[str]
+) -> int:
+    writer = csv.writer(fh)
+    writer.writerow(columns)
+    n = 0
+    for batch in batches:
+        writer.writerows(batch)
+        n += len(batch)
+    return n
+
+
+def _write_jsonl(
+    batches: Iterator[list[tuple[Any, ...]]], columns: Sequence[str], fh: IO[str]
+) -> int:
+    n = 0
+    for batch in batches:
+        fh.writelines(json.dumps(dict(zip(columns, row))) + "\n" for row in batch)
+        n += len(batch)
+    return n
+
+
+def _write_columnar(
+    batches: Iterator[list[tuple[Any, ...]]], columns: Sequence[str], fh: IO[bytes]
+) -> int:
+    types = [_col_type(c) for c in columns]
+    header = json.dumps({"columns": list(columns), "types": types}).encode()
+    fh.write(COL_MAGIC)
+    fh.write(struct.pack("<I", len(header)))
+    fh.write(header)
+    n = 0
+    for batch in batches:
+        fh.write(struct.pack("<I", len(batch)))
+        for i, kind in enumerate(types):
+            if kind == "date":
+                col = array("i", (r[i] for r in batch))
+            elif kind == "f8":
+                col = array("d", (math.nan if r[i] is None else r[i] for r in batch))
+            else:
+                col = array("i", (COL_INT_NULL if r[i] is None else r[i] for r in batch))
+            if sys.byteorder == "big":
+                col.byteswap()
+            fh.write(col.tobytes())
+        n += len(batch)
+    fh.write(struct.pack("<I", 0))
+    return n
+
+
+def iter_columnar(path: Path) -> Iterator[dict[str, array]]:
+    """Read a "col" export back, one ``{column: array}`` block at a time."""
+    with open(path, "rb") as fh:
+        if fh.read(len(COL_MAGIC)) != COL_MAGIC:
+            raise ValueError(f"{path} is not a columnar export")
+        (size,) = struct.unpack("<I", fh.read(4))
+        header = json.loads(fh.read(size))
+        while True:
+            (nrows,) = struct.unpack("<I", fh.read(4))
+            if not nrows:
+                return
+            block: dict[str, array] = {}
+            for column, kind in zip(header["columns"], header["types"]):
+                col = array(_COL_TYPECODES[kind])
+                col.frombytes(fh.read(nrows * col.itemsize))
+                if sys.byteorder == "big":
+                    col.byteswap()
+                block[column] = col
+            yield block
+
+
+@_profiled
+def export_entries(
+    out: Path | None,
+    fmt: str = "csv",
+    start: str | None = None,
+    end: str | None = None,
+    columns: Sequence[str] | None = None,
+    batch_size: int = EXPORT_BATCH,
+) -> int:
+    """Stream entries to ``out`` (stdout when ``None``) and return the row count."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+    cols = _select_columns(columns)
+    batches = iter_batches(start, end, cols, batch_size, epoch_days=fmt == "col")
+    if fmt == "col":
+        if out is None:
+            return _write_columnar(batches, cols, sys.stdout.buffer)
+        with open(out, "wb") as fh:
+            return _write_columnar(batches, cols, fh)
+    write = _write_csv if fmt == "csv" else _write_jsonl
+    if out is None:
+        return write(batches, cols, sys.stdout)
+    with open(out, "w", newline="", encoding="utf-8") as fh:
+        return write(batches, cols, fh)
+
+
+# ---------------------------------------------------------------------------
+# Analytics
+# ---------------------------------------------------------------------------
+#
+# Everything here works on whole NumPy columns: the selected metrics are read
+# in one query, laid out on a calendar-day grid (missing days are NaN), and
+# rolling windows / correlations are computed with cumulative sums and matrix
+# products rather than per-row Python loops. NumPy is imported on first use.
+
+STATS_WINDOW = 7
+STATS_Z = 3.0
+
+
+@dataclass(slots=True)
+class Stats:
+    metrics: list[str]
+    window: int
+    dates: np.ndarray  # datetime64[D], one per calendar day in range
+    values: np.ndarray  # (days, metrics), NaN where no entry
+    rolling_mean: np.ndarray
+    rolling_std: np.ndarray
+    zscores: np.ndarray  # vs. the preceding window, NaN until it fills
+    anomalies: np.ndarray  # |zscore| >= threshold
+    corr: np.ndarray  # (metrics, metrics) pairwise-complete Pearson r
+
+
+def _stats_metrics(metrics: Sequence[str] | None) -> list[str]:
+    if not metrics:
+        return list(_rollup_metrics())
+    return [m for m in _select_columns(metrics) if m != "date"]
+
+
+def load_columns(
+    metrics: Sequence[str] | None = None,
+    start: str | None = None,
+    end: str | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(dates, values)`` for ``metrics`` on a dense daily grid."""
+    import numpy as np
+
+    cols = _stats_metrics(metrics)
+    day_view, value_views = series_cache().frame(cols, start, end)
+    if not len(day_view):
+        return np.empty(0, "datetime64[D]"), np.empty((0, len(cols)))
+    days = np.frombuffer(day_view, dtype=np.int32)
+    offsets = days - days[0]
+    values = np.full((offsets[-1] + 1, len(cols)), np.nan)
+    for j, view in enumerate(value_views):
+        values[offsets, j] = np.frombuffer(view)
+    dates = (days[0] + np.arange(len(values))).astype("datetime64[D]")
+    return dates, values
+
+
+def _rolling(
+    values: np.ndarray, window: int, min_periods: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """NaN-aware trailing mean and sample std over ``window`` rows."""
+    import numpy as np
+
+    valid = ~np.isnan(values)
+    x = np.where(valid, values, 0.0)
+    zero = np.zeros((1, values.shape[1]))
+    csum = np.concatenate([zero, np.cumsum(x, axis=0)])
+    csq = np.concatenate([zero, np.cumsum(x * x, axis=0)])
+    ccount = np.concatenate([zero, np.cumsum(valid, axis=0)])
+    hi = np.arange(1, len(values) + 1)
+    lo = np.maximum(hi - window, 0)
+    n = ccount[hi] - ccount[lo]
+    total = csum[hi] - csum[lo]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / n
+        var = (csq[hi] - csq[lo] - total * mean) / (n - 1)
+    enough = n >= max(min_periods, 2)
+    return (
+        np.where(n >= min_periods, mean, np.nan),
+        np.where(enough, np.sqrt(np.clip(var, 0, None)), np.nan),
+    )
+
+
+def _correlate(values: np.ndarray) -> np.ndarray:
+    """Pearson r for every column pair, each over the rows both have data."""
+    import numpy as np
+
+    valid = (~np.isnan(values)).astype(float)
+    x = np.where(valid > 0, values, 0.0)
+    n = valid.T @ valid
+    sx = x.T @ valid  # sx[i, j]: sum of column i where j is also present
+    sxx = (x * x).T @ valid
+    sxy = x.T @ x
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cov = sxy - sx * sx.T / n
+        var_i = sxx - sx * sx / n
+        r = cov / np.sqrt(var_i * var_i.T)
+    r[n < 3] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
+
+@_profiled
+def compute_stats(
+    metrics: Sequence[str] | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    window: int = STATS_WINDOW,
+    threshold: float = STATS_Z,
+) -> Stats:
+    """Rolling stats, z-score anomaly flags and correlations for ``metrics``."""
+    import numpy as np
+
+    if window < 2:
+        raise ValueError("Window must be at least 2 days")
+    dates, values = load_columns(metrics, start, end)
+    mean, std = _rolling(values, window, max(2, window // 2))
+    # Score each day against the window that ends the day before it.
+    prev_mean = np.full_like(mean, np.nan)
+    prev_std = np.full_like(std, np.nan)
+    prev_mean[1:] = mean[:-1]
+    prev_std[1:] = std[:-1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (values - prev_mean) / prev_std
+    z[~np.isfinite(z)] = np.nan
+    return Stats(
+        metrics=_stats_metrics(metrics),
+        window=window,
+        dates=dates,
+        values=values,
+        rolling_mean=mean,
+        rolling_std=std,
+        zscores=z,
+        anomalies=np.abs(z) >= threshold,
+        corr=_correlate(values),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -163,27 +1777,239 @@ def fetch_series(metric: str, days: int | None = None) -> list[tuple[str, float]
 # ---------------------------------------------------------------------------
 
 
+@_profiled
 def _render_table(rows: Sequence[sqlite3.Row]) -> None:
+    columns = rows[0].keys() if rows else Entry.columns()
     tbl = Table(show_header=True, header_style="bold magenta")
-    for col in Entry.columns():
+    for col in columns:
         tbl.add_column(col)
     for r in rows:
-        tbl.add_row(*[str(r[col]) for col in Entry.columns()])
+        tbl.add_row(*[str(r[col]) for col in columns])
     console.print(tbl)
 
 
-def _plot(metric: str, days: int | None = None) -> None:
-    series = fetch_series(metric, days)
-    if not series:
+def _fmt(value: float) -> str:
+    return "–" if math.isnan(value) else f"{value:.2f}"
+
+
+def _render_stats(s: Stats, recent: int = 10) -> None:
+    import numpy as np
+
+    present = ~np.isnan(s.values)
+    has_roll = ~np.isnan(s.rolling_mean)
+    # Index of the last day with a rolling value, per metric (-1 if none).
+    last = np.where(
+        has_roll.any(axis=0), len(s.dates) - 1 - np.argmax(has_roll[::-1], axis=0), -1
+    )
+    counts = present.sum(axis=0)
+    # nansum / count rather than np.nanmean, which warns on an empty column.
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.nansum(s.values, axis=0) / counts
+    summary = Table(
+        title=f"Rolling {s.window}-day stats", header_style="bold magenta"
+    )
+    for col in ("metric", "days", "mean", "rolling mean", "rolling std", "anomalies"):
+        summary.add_column(col)
+    flagged = s.anomalies.sum(axis=0)
+    for j, metric in enumerate(s.metrics):
+        i = last[j]
+        summary.add_row(
+            metric,
+            str(counts[j]),
+            _fmt(means[j]),
+            _fmt(s.rolling_mean[i, j] if i >= 0 else math.nan),
+            _fmt(s.rolling_std[i, j] if i >= 0 else math.nan),
+            str(flagged[j]),
+        )
+    console.print(summary)
+
+    corr = Table(title="Correlation (Pearson r)", header_style="bold magenta")
+    corr.add_column("")
+    for metric in s.metrics:
+        corr.add_column(metric, justify="right")
+    for i, metric in enumerate(s.metrics):
+        cells = []
+        for r in s.corr[i]:
+            style = "green" if r >= 0.3 else "red" if r <= -0.3 else "dim"
+            cells.append(f"[{style}]{_fmt(r)}[/{style}]")
+        corr.add_row(metric, *cells)
+    console.print(corr)
+
+    days, cols = np.nonzero(s.anomalies)
+    if recent and len(days):
+        anomalies = Table(title="Recent anomalies", header_style="bold magenta")
+        for col in ("date", "metric", "value", "z"):
+            anomalies.add_column(col)
+        for i, j in zip(days[::-1][:recent], cols[::-1][:recent]):
+            anomalies.add_row(
+                str(s.dates[i]),
+                s.metrics[j],
+                _fmt(s.values[i, j]),
+                _fmt(s.zscores[i, j]),
+            )
+        console.print(anomalies)
+
+
+# ---------------------------------------------------------------------------
+# Charts
+# ---------------------------------------------------------------------------
+#
+# render_chart() draws on a bare matplotlib Figure (Agg canvas, no pyplot and
+# no display needed), thins long series with largest-triangle-three-buckets
+# and caches the image on disk. The cache key includes data_version(), so a
+# write anywhere invalidates every cached chart without any bookkeeping.
+
+CHART_CACHE = Path(
+    os.environ.get("BP_TRACKER_CACHE", Path.home() / ".cache" / "bp_tracker")
+) / "charts"
+CHART_FORMATS = ("png", "svg")
+CHART_SIZE = (800, 450)  # pixels
+CHART_DPI = 100
+CHART_POINTS = 500  # LTTB target
+MARKER_POINTS = 60  # draw point markers only for sparse series
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Indices of ``threshold`` points chosen by largest-triangle-three-buckets.
+
+    Keeps the first and last points; from each bucket in between, picks the
+    point forming the largest triangle with the previous pick and the mean of
+    the next bucket, which preserves peaks and troughs far better than
+    striding.
+    """
+    import numpy as np
+
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    picked = np.empty(threshold, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        cx = x[nxt_lo:nxt_hi].mean()
+        cy = y[nxt_lo:nxt_hi].mean()
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+
+def _chart_title(metric: str, resolution: str) -> str:
+    title = metric.replace("_", " ").title()
+    return title if resolution == "day" else f"{title} ({resolution}ly mean)"
+
+
+def _chart_series(
+    metric: str, days: int | None, resolution: str, max_points: int
+) -> tuple[str, np.ndarray, np.ndarray]:
+    """Trend for ``metric`` as datetime64/float arrays, NaNs dropped, thinned."""
+    import numpy as np
+
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Unknown resolution: {resolution}")
+    resolution = _resolve_resolution(resolution, days)
+    if resolution == "day":
+        start = _days_ago(days) if days is not None else None
+        day_view, value_view = series_cache().series(metric, start)
+        dates = np.frombuffer(day_view, dtype=np.int32).astype("datetime64[D]")
+        values = np.frombuffer(value_view)
+    else:
+        resolution, series = fetch_trend(metric, days, resolution)
+        if not series:
+            return resolution, np.empty(0, "datetime64[D]"), np.empty(0)
+        raw = np.array(series, dtype=object)
+        dates = raw[:, 0].astype("datetime64[D]")
+        values = raw[:, 1].astype(float)
+    keep = ~np.isnan(values)
+    dates, values = dates[keep], values[keep]
+    idx = lttb(dates.astype(np.int64), values, max_points)
+    return resolution, dates[idx], values[idx]
+
+
+def _draw(ax, metric: str, resolution: str, dates, values) -> None:
+    import matplotlib.dates as mdates
+
+    marker = "o" if len(dates) <= MARKER_POINTS else None
+    ax.plot(dates, values, marker=marker, linewidth=1)
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+    ax.set_title(_chart_title(metric, resolution))
+    ax.set_xlabel("Date")
+    ax.set_ylabel(metric)
+    ax.grid(alpha=0.3)
+
+
+@_profiled
+def render_chart(
+    metric: str,
+    days: int | None = None,
+    resolution: str = "auto",
+    size: tuple[int, int] = CHART_SIZE,
+    fmt: str = "png",
+    max_points: int = CHART_POINTS,
+) -> Path | None:
+    """Render ``metric`` to an image file and return its cached path.
+
+    Returns None when there is nothing to plot. Repeat calls with the same
+    arguments and unchanged data return the cached file without plotting.
+    """
+    if fmt not in CHART_FORMATS:
+        raise ValueError(f"Unknown chart format: {fmt}")
+    if metric not in _rollup_metrics():
+        raise ValueError(f"Unknown metric: {metric}")
+    params = json.dumps(
+        [str(DB_PATH), metric, days, resolution, size, max_points], default=str
+    )
+    stem = f"{metric}-{hashlib.sha1(params.encode()).hexdigest()[:16]}"
+    # A relative range moves with the calendar, so its start date is part of
+    # the version rather than the stem: yesterday's file is pruned below.
+    version = str(data_version())
+    if days is not None:
+        version += f"-{_days_ago(days)}"
+    path = CHART_CACHE / f"{stem}-{version}.{fmt}"
+    if path.exists():
+        return path
+    resolution, dates, values = _chart_series(metric, days, resolution, max_points)
+    if not len(dates):
+        return None
+
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(size[0] / CHART_DPI, size[1] / CHART_DPI), dpi=CHART_DPI)
+    _draw(fig.add_subplot(), metric, resolution, dates, values)
+    fig.tight_layout()
+    CHART_CACHE.mkdir(parents=True, exist_ok=True)
+    # Earlier data versions and start dates of this chart can never be hit again.
+    for stale in CHART_CACHE.glob(f"{stem}-*.{fmt}"):
+        stale.unlink(missing_ok=True)
+    tmp = path.with_suffix(f".tmp{os.getpid()}")
+    fig.savefig(tmp, format=fmt)
+    tmp.replace(path)
+    return path
+
+
+@_profiled
+def _plot(
+    metric: str,
+    days: int | None = None,
+    resolution: str = "auto",
+    max_points: int = CHART_POINTS,
+) -> None:
+    resolution, dates, values = _chart_series(metric, days, resolution, max_points)
+    if not len(dates):
         console.print("No data to plot.")
         raise typer.Exit()
-    dates, values = zip(*series)
+    plt = _pyplot()
     fig, ax = plt.subplots()
-    ax.plot(dates, values, marker="o")
-    ax.set_title(metric.replace("_", " ").title())
-    ax.set_xlabel("Date")
-    ax.set_ylabel(metric)
-    ax.tick_params(axis="x", rotation=45)
+    _draw(ax, metric, resolution, dates, values)
     plt.tight_layout()
     plt.show()
 
@@ -193,16 +2019,41 @@ def _plot(metric: str, days: int | None = None) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _parse_date_opt(value: str | None) -> str | None:
+    if value is None:
+        return None
+    try:
+        return _dt.date.fromisoformat(value).strftime(DATE_FMT)
+    except ValueError:
+        raise typer.BadParameter(f"Expected YYYY-MM-DD, got {value!r}")
+
+
+@app.callback()
+def main(
+    profile: bool = typer.Option(
+        False, "--profile", help="Print stage and SQL timings to stderr at exit"
+    ),
+    profile_out: Path | None = typer.Option(
+        None, help="Write the timings to this JSON file instead"
+    ),
+):
+    """Well-being tracker: daily metrics in SQLite."""
+    if profile or profile_out:
+        enable_profiling(profile_out)
+
+
 @app.command()
 def add(
-    date: str = typer.Option(_dt.date.today().strftime(DATE_FMT), help="YYYY-MM-DD"),
+    date: str = typer.Option(
+        _dt.date.today().strftime(DATE_FMT), callback=_parse_date_opt, help="YYYY-MM-DD"
+    ),
     sleep_hours: float = typer.Option(..., prompt=True),
     hrv: float = typer.Option(..., prompt=True),
     typing_variability: float = typer.Option(..., prompt=True, help="Std-dev in ms"),
     speech_rate: int = typer.Option(..., prompt=True, help="Words per minute"),
-    mood: int = typer.Option(..., prompt=True, help="1-10"),
-    output_quality: int = typer.Option(..., prompt=True, help="1-10"),
-    spiritual_depth: int = typer.Option(..., prompt=True, help="1-10"),
+    mood: int = typer.Option(..., prompt=True, min=1, max=10, help="1-10"),
+    output_quality: int = typer.Option(..., prompt=True, min=1, max=10, help="1-10"),
+    spiritual_depth: int = typer.Option(..., prompt=True, min=1, max=10, help="1-10"),
 ):
     """Add or replace an entry (prompts if unspecified)."""
     entry = Entry(
@@ -219,32 +2070,265 @@ def add(
     console.print(f"[green]Saved entry for {date}.[/green]")
 
 
-@app.command()
-def list(
+@app.command("list")
+def list_entries(
     days: int | None = typer.Option(None, help="Limit to N recent days"),
+    start: str | None = typer.Option(None, help="First date, YYYY-MM-DD"),
+    end: str | None = typer.Option(None, help="Last date, YYYY-MM-DD"),
+    metric: List[str] = typer.Option([], "--metric", "-m", help="Repeat to select"),
+    page_size: int | None = typer.Option(None, min=1, help="Rows per page"),
+    after: str | None = typer.Option(None, help="Page cursor from a previous run"),
 ):
-    """Display entries in a table."""
-    rows = fetch_entries(days)
-    _render_table(rows)
+    """Display entries in a table, newest first."""
+    start = _days_ago(days) if days is not None else _parse_date_opt(start)
+    try:
+        page = query_entries(
+            start, _parse_date_opt(end), metric or None, page_size, after
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+    _render_table(page.rows)
+    if page.next_cursor is not None:
+        console.print(f"[dim]More entries: --after {page.next_cursor}[/dim]")
 
 
 @app.command()
 def chart(
     metric: str = typer.Argument(..., help="Metric name"),
     days: int | None = typer.Option(None, help="Limit to N recent days"),
+    resolution: str = typer.Option("auto", help="auto, day, week or month"),
+    out: Path | None = typer.Option(None, help="Write a .png/.svg instead of showing"),
+    width: int = typer.Option(CHART_SIZE[0], help="Image width in pixels"),
+    height: int = typer.Option(CHART_SIZE[1], help="Image height in pixels"),
+    max_points: int = typer.Option(CHART_POINTS, help="Downsample to this many points"),
 ):
     """Plot a metric over time."""
-    _plot(metric, days)
+    try:
+        if out is None:
+            _plot(metric, days, resolution, max_points)
+            return
+        fmt = out.suffix.lstrip(".").lower() or "png"
+        path = render_chart(
+            metric, days, resolution, (width, height), fmt, max_points
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+    if path is None:
+        console.print("No data to plot.")
+        raise typer.Exit()
+    shutil.copyfile(path, out)
+    console.print(f"[green]Wrote {out}.[/green]")
+
+
+@app.command()
+def stats(
+    metric: List[str] = typer.Option([], "--metric", "-m", help="Repeat to select"),
+    days: int | None = typer.Option(None, help="Limit to N recent days"),
+    start: str | None = typer.Option(None, help="First date, YYYY-MM-DD"),
+    end: str | None = typer.Option(None, help="Last date, YYYY-MM-DD"),
+    window: int = typer.Option(STATS_WINDOW, help="Rolling window in days"),
+    threshold: float = typer.Option(STATS_Z, help="|z| that counts as an anomaly"),
+    recent: int = typer.Option(10, help="Number of recent anomalies to list"),
+):
+    """Rolling stats, anomalies and cross-metric correlations."""
+    start = _days_ago(days) if days is not None else _parse_date_opt(start)
+    try:
+        result = compute_stats(
+            metric or None, start, _parse_date_opt(end), window, threshold
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+    if not len(result.dates):
+        console.print("No data for these dates.")
+        raise typer.Exit()
+    _render_stats(result, recent)
+
+
+@app.command()
+def export(
+    out: Path | None = typer.Argument(None, help="Output file (stdout if omitted)"),
+    fmt: str = typer.Option("csv", "--format", "-f", help="csv, jsonl or col"),
+    start: str | None = typer.Option(None, help="First date, YYYY-MM-DD"),
+    end: str | None = typer.Option(None, help="Last date, YYYY-MM-DD"),
+    days: int | None = typer.Option(None, help="Limit to N recent days"),
+    column: List[str] = typer.Option([], "--column", "-c", help="Repeat to select"),
+    batch_size: int = typer.Option(EXPORT_BATCH, help="Rows fetched per batch"),
+):
+    """Stream entries to CSV, JSONL or a columnar binary file."""
+    if fmt not in EXPORT_FORMATS:
+        raise typer.BadParameter(f"Format must be one of {', '.join(EXPORT_FORMATS)}")
+    if fmt == "col" and out is None:
+        raise typer.BadParameter("The col format needs an output file")
+    start = _days_ago(days) if days is not None else _parse_date_opt(start)
+    try:
+        n = export_entries(
+            out, fmt, start, _parse_date_opt(end), column or None, batch_size
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+    if out is not None:
+        console.print(f"[green]Exported {n} entries to {out}.[/green]")
+
+
+def _csv_record(rec: dict[str, str]) -> dict[str, Any]:
+    """A CSV row as Entry fields: empty is missing, numbers per Entry.types()."""
+    types = Entry.types()
+    out: dict[str, Any] = {}
+    for key, value in rec.items():
+        if not value:
+            out[key] = None
+        elif types.get(key) == "float":
+            out[key] = float(value)
+        elif types.get(key) == "int":
+            out[key] = int(value)
+        else:
+            out[key] = value
+    return out
+
+
+@app.command("import")
+def import_(
+    path: Path = typer.Argument(..., exists=True, dir_okay=False),
+    fmt: str = typer.Option("csv", "--format", "-f", help="csv or jsonl"),
+):
+    """Bulk insert or replace entries from a CSV or JSONL export."""
+    if fmt not in ("csv", "jsonl"):
+        raise typer.BadParameter("Format must be csv or jsonl")
+    with open(path, newline="", encoding="utf-8") as fh:
+        if fmt == "csv":
+            records = map(_csv_record, csv.DictReader(fh))
+        else:
+            records = map(json.loads, fh)
+        try:
+            n = add_entries(Entry(**rec) for rec in records)
+        except TypeError as exc:
+            raise typer.BadParameter(f"Not a full entry record: {exc}")
+        except ValueError as exc:
+            raise typer.BadParameter(f"Bad value, nothing imported: {exc}")
+        except sqlite3.IntegrityError as exc:
+            raise typer.BadParameter(f"Rejected by the schema, nothing imported: {exc}")
+    console.print(f"[green]Imported {n} entries from {path}.[/green]")
+
+
+@app.command("rebuild-rollups")
+def rebuild_rollups_cmd():
+    """Recompute the weekly and monthly rollup tables from scratch."""
+    rebuild_rollups()
+    console.print("[green]Rollups rebuilt.[/green]")
+
+
+@app.command()
+def ingest(
+    path: str = typer.Argument(..., help="CSV or JSONL of metric, ts, value; - for stdin"),
+    fmt: str = typer.Option("csv", "--format", "-f", help="csv or jsonl"),
+    batch_size: int = typer.Option(SAMPLE_BATCH, min=1, help="Samples per transaction"),
+    downsample: bool = typer.Option(True, help="Refresh the days the samples fall on"),
+):
+    """Stream raw sensor samples into the samples table.
+
+    ``ts`` is Unix milliseconds or an ISO 8601 timestamp; ``metric`` is one
+    of hrv, typing_variability or speech_rate.
+    """
+    if fmt not in ("csv", "jsonl"):
+        raise typer.BadParameter("Format must be csv or jsonl")
+    fh = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+    try:
+        records = csv.DictReader(fh) if fmt == "csv" else map(json.loads, fh)
+        with SampleWriter(batch_size=batch_size) as writer:
+            try:
+                writer.extend((r["metric"], r["ts"], r["value"]) for r in records)
+            except (KeyError, TypeError, ValueError) as exc:
+                raise typer.BadParameter(f"Bad sample record: {exc}")
+    finally:
+        if fh is not sys.stdin:
+            fh.close()
+    console.print(f"[green]Ingested {writer.written} samples.[/green]")
+    if downsample and writer.span:
+        lo, hi = (_ms_date(ts).strftime(DATE_FMT) for ts in writer.span)
+        n = downsample_samples(lo, hi)
+        console.print(f"[green]Updated {n} daily entries ({lo} to {hi}).[/green]")
+
+
+@app.command("downsample")
+def downsample_cmd(
+    start: str | None = typer.Option(None, help="First day (default: first sample)"),
+    end: str | None = typer.Option(None, help="Last day (default: last sample)"),
+):
+    """Recompute daily hrv, typing_variability and speech_rate from samples."""
+    n = downsample_samples(_parse_date_opt(start), _parse_date_opt(end))
+    console.print(f"[green]Updated {n} daily entries.[/green]")
+
+
+@app.command()
+def serve(
+    socket_path: Path = typer.Option(
+        DB_PATH.with_suffix(".sock"), "--socket", help="Unix socket to listen on"
+    ),
+    port: int | None = typer.Option(None, help="Serve HTTP on 127.0.0.1:PORT instead"),
+    batch_secs: float = typer.Option(SERVE_BATCH_SECS, min=0.0, help="Write batch window"),
+    downsample_secs: float = typer.Option(
+        SERVE_DOWNSAMPLE_SECS, min=0.0, help="Re-derive sampled days this often"
+    ),
+):
+    """Accept JSON entries and samples over a socket and write them in batches.
+
+    Unix socket: one JSON record per line; send {"op": "stats"} for stats.
+    HTTP: POST records to /, GET /stats.
+    """
+    _init_db()
+    ingest = IngestQueue(batch_secs, downsample_secs)
+    server = _http_server(port, ingest) if port else _unix_server(socket_path, ingest)
+    where = f"http://127.0.0.1:{port}" if port else str(socket_path)
+
+    def terminate(signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, terminate)
+    ingest.start()
+    console.print(f"[green]Listening on {where} (Ctrl-C to stop).[/green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if not port:
+            socket_path.unlink(missing_ok=True)
+        ingest.stop()
+    stats = ingest.stats()
+    tbl = Table(title="serve", header_style="bold magenta")
+    tbl.add_column("stat")
+    tbl.add_column("value", justify="right")
+    for key, value in stats.items():
+        if key != "last_batch":
+            tbl.add_row(key, str(value))
+    console.print(tbl)
 
 
 # ---------------------------------------------------------------------------
 # Textual TUI
 # ---------------------------------------------------------------------------
 
-if App is not None:
+def _tui_app() -> type | None:
+    """Build the Textual app class, or return None if textual is missing."""
+    try:
+        from textual.app import App, ComposeResult
+        from textual.containers import Horizontal
+        from textual.screen import Screen
+        from textual.widgets import (
+            Header,
+            Footer,
+            Button,
+            Static,
+            DataTable,
+            Input,
+            Label,
+        )
+    except ImportError:
+        return None
 
-    class AddEntryView(Container):
-        """Form for a new daily entry."""
+    class AddEntryView(Screen):
+        """Form for a new daily entry; dismisses with the saved Entry."""
 
         DEFAULT_CSS = """AddEntryView { align: center middle; } Label {width:20} Input {width:20}"""
 
@@ -257,44 +2341,176 @@ if App is not None:
             self.hrv_in = Input(placeholder="HRV")
             self.typing_in = Input(placeholder="Typing variability (ms)")
             self.speech_in = Input(placeholder="Speech rate (wpm)")
-            self.mood_in = Slider(low=1, high=10, show_value=True, value=7, name="Mood")
-            self.output_in = Slider(
-                low=1, high=10, show_value=True, value=7, name="Output quality"
-            )
-            self.spiritual_in = Slider(
-                low=1, high=10, show_value=True, value=5, name="Spiritual depth"
-            )
-            yield Label("Date"), self.date_in
-            yield Label("Sleep"), self.sleep_in
-            yield Label("HRV"), self.hrv_in
-            yield Label("Typing sd"), self.typing_in
-            yield Label("Speech"), self.speech_in
-            yield self.mood_in
-            yield self.output_in
-            yield self.spiritual_in
+            self.mood_in = Input(value="7", placeholder="1-10", type="integer")
+            self.output_in = Input(value="7", placeholder="1-10", type="integer")
+            self.spiritual_in = Input(value="5", placeholder="1-10", type="integer")
+            for label, field in (
+                ("Date", self.date_in),
+                ("Sleep", self.sleep_in),
+                ("HRV", self.hrv_in),
+                ("Typing sd", self.typing_in),
+                ("Speech", self.speech_in),
+                ("Mood", self.mood_in),
+                ("Output quality", self.output_in),
+                ("Spiritual depth", self.spiritual_in),
+            ):
+                yield Horizontal(Label(label), field)
             yield Horizontal(Button("Save", id="save"), Button("Cancel", id="cancel"))
 
         def on_button_pressed(self, event: Button.Pressed) -> None:  # type: ignore
             if event.button.id == "cancel":
-                self.app.pop_screen()
+                self.dismiss(None)
                 return
             try:
                 entry = Entry(
-                    date=self.date_in.value,
+                    date=_dt.date.fromisoformat(self.date_in.value).strftime(DATE_FMT),
                     sleep_hours=float(self.sleep_in.value),
                     hrv=float(self.hrv_in.value),
                     typing_variability=float(self.typing_in.value),
                     speech_rate=int(self.speech_in.value),
-                    mood=int(self.mood_in.value),  # type: ignore
-                    output_quality=int(self.output_in.value),  # type: ignore
-                    spiritual_depth=int(self.spiritual_in.value),  # type: ignore
+                    mood=int(self.mood_in.value),
+                    output_quality=int(self.output_in.value),
+                    spiritual_depth=int(self.spiritual_in.value),
                 )
             except ValueError:
                 self.app.bell()
                 return
+            if not all(
+                1 <= score <= 10
+                for score in (entry.mood, entry.output_quality, entry.spiritual_depth)
+            ):
+                self.app.bell()
+                return
             add_entry(entry)
-            self.app.pop_screen()
-            self.app.query_one("#status", Static).update(f"✅ Saved {entry.date}")
+            self.dismiss(entry)
+
+    class HistoryTable(DataTable):
+        """History, newest first, read in keyset pages as the view scrolls.
+
+        At most TUI_WINDOW rows are held: paging further in one direction
+        drops rows from the other end, which are re-read if scrolled back to.
+        Cells keep their raw values, so DataTable formats only visible rows.
+        """
+
+        newest: str | None = None  # first loaded date
+        oldest: str | None = None  # last loaded date
+        at_head = True  # nothing newer than the window
+        at_tail = False  # nothing older than the window
+        _settling = False  # repositioning after a page load; don't page
+        _paging_due = False
+
+        def reset(self) -> None:
+            self.newest = self.oldest = None
+            self.at_head, self.at_tail = True, False
+            self._settling = True
+            self.clear(columns=True)
+            for col in Entry.columns():
+                self.add_column(col, key=col)
+            self._settling = False
+            self.load_older()
+
+        def _append(self, rows: Sequence[sqlite3.Row]) -> None:
+            for r in rows:
+                self.add_row(*r, key=r["date"])
+
+        def load_older(self) -> None:
+            if self.at_tail:
+                return
+            page = query_entries(limit=TUI_PAGE, after=self.oldest)
+            self._append(page.rows)
+            self.at_tail = page.next_cursor is None
+            if page.rows:
+                self.oldest = page.rows[-1]["date"]
+                self.newest = self.newest or page.rows[0]["date"]
+            self._settle(trim_top=True, shift=0)
+
+        def load_newer(self) -> None:
+            if self.at_head:
+                return
+            page = query_entries(limit=TUI_PAGE, after=self.newest, descending=False)
+            self._append(page.rows)
+            self.sort("date", reverse=True)
+            self.at_head = page.next_cursor is None
+            if page.rows:
+                self.newest = page.rows[-1]["date"]
+            self._settle(trim_top=False, shift=len(page.rows))
+
+        def _settle(self, trim_top: bool, shift: int) -> None:
+            """Cap the window at TUI_WINDOW rows and keep the view steady.
+
+            ``shift`` rows were just added above the view; rows trimmed from
+            the top move it the other way.
+            """
+            excess = max(self.row_count - TUI_WINDOW, 0)
+            moved = shift - (excess if trim_top else 0)
+            cursor, scroll = self.cursor_row + moved, self.scroll_y + moved
+            if not excess and not moved:
+                return
+            self._settling = True
+            if excess:
+                rows = self.ordered_rows
+                kept = rows[excess:] if trim_top else rows[:-excess]
+                # remove_row() is O(rows) per call; rebuilding the kept window
+                # in one pass is far cheaper than dropping a page row by row.
+                data = [self.get_row(row.key) for row in kept]
+                self.clear()
+                for values in data:
+                    self.add_row(*values, key=values[0])
+                if trim_top:
+                    self.newest, self.at_head = data[0][0], False
+                else:
+                    self.oldest, self.at_tail = data[-1][0], False
+            self.move_cursor(row=max(cursor, 0), scroll=False)
+            self.scroll_to(y=max(scroll, 0), animate=False)
+            self.call_after_refresh(setattr, self, "_settling", False)
+
+        # Scrolling and cursor moves only schedule a check: DataTable actions
+        # such as page-down scroll first and then move the cursor by index,
+        # so the window must not change under them mid-action.
+
+        def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+            super().watch_scroll_y(old_value, new_value)
+            self._schedule_paging()
+
+        def watch_cursor_coordinate(self, old_coordinate, new_coordinate) -> None:
+            super().watch_cursor_coordinate(old_coordinate, new_coordinate)
+            self._schedule_paging()
+
+        def _schedule_paging(self) -> None:
+            if not self._settling and not self._paging_due:
+                self._paging_due = True
+                self.call_after_refresh(self._page_if_near_edge)
+
+        def _page_if_near_edge(self) -> None:
+            self._paging_due = False
+            if self._settling:
+                return
+            margin = self.size.height + TUI_PAGE // 4
+            if (
+                self.cursor_row >= self.row_count - margin
+                or self.scroll_y >= self.max_scroll_y - margin
+            ):
+                self.load_older()
+            elif self.cursor_row <= margin or self.scroll_y <= margin:
+                self.load_newer()
+
+        def upsert(self, entry: Entry) -> None:
+            """Show a saved entry, touching only its own row."""
+            values = asdict(entry)
+            if entry.date in self.rows:
+                for col, value in values.items():
+                    self.update_cell(entry.date, col, value)
+                return
+            newer = self.newest is None or entry.date > self.newest
+            older = self.oldest is not None and entry.date < self.oldest
+            if (newer and not self.at_head) or (older and not self.at_tail):
+                return  # outside the loaded window; read when scrolled to
+            self.add_row(*values.values(), key=entry.date)
+            self.sort("date", reverse=True)
+            if newer:
+                self.newest = entry.date
+            if older or self.oldest is None:
+                self.oldest = entry.date
 
     class TrackerApp(App):
         CSS_PATH = None
@@ -306,36 +2522,49 @@ if App is not None:
 
         def compose(self) -> ComposeResult:  # type: ignore
             yield Header()
-            with Container():
-                self.table = DataTable(zebra_stripes=True)
-                yield self.table
-                yield Static("", id="status")
+            self.table = HistoryTable(zebra_stripes=True, cursor_type="row")
+            self.status = Static("", id="status")
+            yield self.table
+            yield self.status
             yield Footer()
 
         def on_mount(self) -> None:
             self.action_list()
+            self.table.focus()
 
         def action_add(self) -> None:
-            self.push_screen(AddEntryView())
+            self.push_screen(AddEntryView(), self.entry_saved)
+
+        def entry_saved(self, entry: Entry | None) -> None:
+            if entry is None:
+                return
+            self.table.upsert(entry)
+            self.status.update(f"✅ Saved {entry.date}")
 
         def action_list(self) -> None:
-            rows = fetch_entries(30)
-            self.table.clear()
-            self.table.add_columns(*Entry.columns())
-            for r in rows:
-                self.table.add_row(*[str(r[c]) for c in Entry.columns()])
-            self.query_one("#status", Static).update(
-                f"Showing last {len(rows)} entries"
-            )
+            self.table.reset()
+            self.update_status()
+
+        def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+            self.update_status()
 
-    def run_tui() -> None:
-        TrackerApp().run()
+        def update_status(self) -> None:
+            table = self.table
+            if not table.row_count:
+                text = "No entries yet."
+            else:
+                text = f"{table.newest} … {table.oldest} ({table.row_count} rows loaded)"
+            self.status.update(text)
+
+    return TrackerApp
 
-else:
 
-    def run_tui() -> None:  # pragma: no cover
+def run_tui() -> None:
+    tracker_app = _tui_app()
+    if tracker_app is None:  # pragma: no cover
         console.print("Install 'textual' to use the terminal UI: pip install textual")
         raise typer.Exit()
+    tracker_app().run()
 
 
 # Typer shim to launch TUI
@@ -350,13 +2579,87 @@ def tui():
 # ---------------------------------------------------------------------------
 
 
+def _heatmap_png(result: Stats) -> bytes:
+    from matplotlib.figure import Figure
+
+    n = len(result.metrics)
+    fig = Figure(figsize=(1 + n, 1 + n * 0.8), dpi=CHART_DPI)
+    ax = fig.add_subplot()
+    im = ax.imshow(result.corr, cmap="RdBu_r", vmin=-1, vmax=1)
+    ax.set_xticks(range(n), result.metrics, rotation=45, ha="right")
+    ax.set_yticks(range(n), result.metrics)
+    for i in range(n):
+        for j in range(n):
+            ax.text(j, i, _fmt(result.corr[i, j]), ha="center", va="center")
+    fig.colorbar(im, ax=ax)
+    ax.set_title("Correlation (Pearson r)")
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    return buf.getvalue()
+
+
 def _run_streamlit() -> None:  # pragma: no cover
     import streamlit as st
 
+    global _profiler, _series_cache
+
+    # Each rerun executes this module afresh; keep one profiler and one
+    # series cache for the whole server process instead of recreating them
+    # on every interaction.
+    @st.cache_resource
+    def shared_profiler() -> Profiler | None:
+        return _profile_from_env()
+
+    @st.cache_resource
+    def shared_series_cache(path: str) -> SeriesCache:
+        return SeriesCache(Path(path))
+
+    _profiler = shared_profiler()
+    _init_db()
+    _series_cache = shared_series_cache(str(DB_PATH))
+
+    # Streamlit reruns this whole function on every widget interaction. The
+    # cached helpers take data_version() as an argument, so they recompute
+    # only after a write (from this form, the CLI or anywhere else).
+
+    @st.cache_data(max_entries=64, show_spinner=False)
+    def cached_chart(
+        metric: str, days: int, resolution: str, version: int
+    ) -> bytes | None:
+        path = render_chart(metric, days, resolution)
+        return path.read_bytes() if path is not None else None
+
+    @st.cache_data(max_entries=64, show_spinner=False)
+    def cached_page(
+        after: str | None, version: int
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        page = query_entries(limit=PAGE_SIZE, after=after)
+        return [dict(zip(row.keys(), row)) for row in page.rows], page.next_cursor
+
+    @st.cache_data(max_entries=16, show_spinner=False)
+    def cached_stats(
+        metrics: tuple[str, ...], days: int, window: int, version: int
+    ) -> tuple[bytes | None, list[dict[str, Any]]]:
+        result = compute_stats(metrics, _days_ago(days), window=window)
+        if not len(result.dates):
+            return None, []
+        days_idx, cols = result.anomalies.nonzero()
+        anomalies = [
+            {
+                "date": str(result.dates[i]),
+                "metric": result.metrics[j],
+                "value": float(result.values[i, j]),
+                "z": round(float(result.zscores[i, j]), 2),
+            }
+            for i, j in zip(days_idx[::-1], cols[::-1])
+        ]
+        return _heatmap_png(result), anomalies
+
     st.set_page_config(page_title="Well-Being Tracker", layout="centered")
     st.title("Well-Being Tracker 📈")
 
-    tabs = st.tabs(["Add Entry", "Dashboard"])
+    tabs = st.tabs(["Add Entry", "Dashboard", "Stats"])
 
     with tabs[0]:
         st.subheader("New daily metrics")
@@ -387,28 +2690,58 @@ def _run_streamlit() -> None:  # pragma: no cover
                 add_entry(entry)
                 st.success(f"Saved entry for {entry.date}")
 
+    # Read after the form so a save in this run is already visible below.
+    version = data_version()
+
     with tabs[1]:
         metric = st.selectbox("Select metric", Entry.columns()[1:])
         days = st.number_input("Days to display", 1, 3650, 30)
+        resolution = st.selectbox("Resolution", RESOLUTIONS)
         if st.button("Show chart"):
-            data = fetch_series(metric, int(days))
-            if not data:
+            image = cached_chart(metric, int(days), resolution, version)
+            if image is None:
                 st.warning("No data to plot.")
             else:
-                dates, values = zip(*data)
-                fig, ax = plt.subplots()
-                ax.plot(dates, values, marker="o")
-                ax.set_title(metric.replace("_", " ").title())
-                ax.set_xlabel("Date")
-                ax.set_ylabel(metric)
-                ax.tick_params(axis="x", rotation=45)
-                st.pyplot(fig)
+                st.image(image)
         st.subheader("Recent entries")
-        rows = fetch_entries(30)
+        # Keyset cursors of the pages above the current one; [None] is page 1.
+        cursors = st.session_state.setdefault("history_cursors", [None])
+        rows, next_cursor = cached_page(cursors[-1], version)
         if rows:
-            st.dataframe([{col: row[col] for col in Entry.columns()} for row in rows])
+            st.dataframe(rows)
         else:
             st.info("No entries yet.")
+        newer, older = st.columns(2)
+        if newer.button("Newer", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+        if older.button("Older", disabled=next_cursor is None):
+            cursors.append(next_cursor)
+            st.rerun()
+
+    with tabs[2]:
+        chosen = st.multiselect(
+            "Metrics", Entry.columns()[1:], default=Entry.columns()[1:]
+        )
+        days = st.number_input("Days to analyse", 7, 3650, 365)
+        window = st.number_input("Rolling window (days)", 2, 365, STATS_WINDOW)
+        if len(chosen) < 2:
+            st.info("Pick at least two metrics.")
+        else:
+            heatmap, anomalies = cached_stats(
+                tuple(chosen), int(days), int(window), version
+            )
+            if heatmap is None:
+                st.info("No entries in this range.")
+            else:
+                st.image(heatmap)
+                st.subheader(f"Anomalies (|z| >= {STATS_Z:g})")
+                st.dataframe(anomalies)
+
+    if _profiler is not None:
+        # The server never exits in normal use, so show the running totals.
+        with st.sidebar.expander("Profile (BP_TRACKER_PROFILE)"):
+            st.json(_profiler.summary())
 
 
 # ---------------------------------------------------------------------------
@@ -422,9 +2755,10 @@ def _is_streamlit_run() -> bool:
     )
 
 
-if _is_streamlit_run():
-    _run_streamlit()
-else:
-    if len(sys.argv) >= 2 and sys.argv[1] == "cli":
-        sys.argv.pop(1)
-    app()
+if __name__ == "__main__":
+    if _is_streamlit_run():
+        _run_streamlit()
+    else:
+        if len(sys.argv) >= 2 and sys.argv[1] == "cli":
+            sys.argv.pop(1)
+        app()